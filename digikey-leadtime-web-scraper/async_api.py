@@ -0,0 +1,105 @@
+"""
+Asyncio batch scraping API
+Runs scrape_part() on a bounded set of scrapers in worker threads so an
+event loop can embed the scraper without blocking.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional
+import asyncio
+import itertools
+import logging
+
+from dedup import group_parts, result_for
+from pool import failed_result
+from rate_limit import AdaptiveRateLimiter
+
+
+logger = logging.getLogger(__name__)
+
+
+def _default_factory() -> Callable[[int], any]:
+    """Headless scrapers pacing their page loads with one shared rate limiter"""
+    from main import DigikeyLeadTimeScraper
+    rate_limiter = AdaptiveRateLimiter()
+    return lambda worker_id: DigikeyLeadTimeScraper(headless=True, rate_limiter=rate_limiter)
+
+
+async def scrape_many(parts: Iterable[str],
+                      concurrency: int = 4,
+                      timeout: Optional[float] = None,
+                      scraper_factory: Optional[Callable[[int], any]] = None,
+                      max_age: Optional[float] = None) -> AsyncIterator[Dict[str, any]]:
+    """
+    Yield scrape_part() results as they complete, at most `concurrency` at a time.
+
+    timeout is per part; a timed-out part yields a failed result and its
+    scraper is closed (which also aborts the blocked driver call) and replaced.
+    A closed scraper refuses to start Chrome again, so the abandoned call
+    can't leak a browser. scraper_factory(worker_id) defaults to headless
+    scrapers sharing one rate limiter; custom factories should share one too.
+    Closing or cancelling the generator cancels pending parts and closes all drivers.
+    Equivalent part numbers (see dedup.py) are scraped once and yielded once
+    per input spelling.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+    loop = asyncio.get_running_loop()
+    scraper_factory = scraper_factory or _default_factory()
+    # Headroom for threads still blocked in a timed-out scraper until its close() lands
+    executor = ThreadPoolExecutor(max_workers=concurrency * 2, thread_name_prefix="scrape-many")
+    semaphore = asyncio.Semaphore(concurrency)
+    idle: List[any] = []
+    scrapers: List[any] = []
+    # Never reuse an id: a replaced scraper may still hold its profile until close() lands
+    worker_ids = itertools.count()
+
+    def close_scraper(scraper):
+        try:
+            scraper.close()
+        except Exception as e:
+            logger.debug(f"Scraper close error: {e}")
+
+    async def run(part_number: str) -> Dict[str, any]:
+        async with semaphore:
+            if idle:
+                scraper = idle.pop()
+            else:
+                scraper = scraper_factory(next(worker_ids))
+                scrapers.append(scraper)
+
+            call = loop.run_in_executor(executor, lambda: scraper.scrape_part(part_number, max_age=max_age))
+            try:
+                result = await asyncio.wait_for(call, timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"⚠️ {part_number}: timed out after {timeout}s")
+                scrapers.remove(scraper)
+                loop.run_in_executor(None, close_scraper, scraper)
+                return failed_result(part_number, f"Timed out after {timeout}s")
+            except asyncio.CancelledError:
+                scrapers.remove(scraper)
+                loop.run_in_executor(None, close_scraper, scraper)
+                raise
+            except Exception as e:
+                logger.error(f"❌ {part_number}: {e}")
+                idle.append(scraper)
+                return failed_result(part_number, str(e))
+
+            idle.append(scraper)
+            return result
+
+    async def run_group(requested: List[str]):
+        return requested, await run(requested[0])
+
+    tasks = [asyncio.ensure_future(run_group(requested)) for requested in group_parts(parts).values()]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            requested, result = await next_done
+            for part_number in requested:
+                yield result_for(result, part_number)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(*(loop.run_in_executor(None, close_scraper, s) for s in scrapers))
+        executor.shutdown(wait=False)
@@ -0,0 +1,124 @@
+"""
+Resumable batch runs: stream part numbers from a CSV/BOM file and journal
+every scrape_part() result to JSONL as soon as it finishes.
+"""
+from typing import Dict, Iterable, Iterator, Optional, Set
+import csv
+import json
+import logging
+import os
+import threading
+
+from cache import normalize_key
+
+
+logger = logging.getLogger(__name__)
+
+# Header names (lowercased) that hold the manufacturer part number in common BOM exports
+PART_COLUMNS = (
+    "part_number",
+    "part number",
+    "mpn",
+    "manufacturer part number",
+    "mfr part #",
+    "mfr. part #",
+    "mfr part number",
+    "part",
+)
+
+
+def read_parts(path: str, column: Optional[str] = None) -> Iterator[str]:
+    """
+    Yield part numbers from a CSV/BOM file (or a plain one-per-line list).
+    Uses `column`, else the first known part-number header, else column 0.
+    """
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+
+        reader = csv.reader(f, dialect)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        names = [name.strip().lower() for name in header]
+        index = None
+        if column:
+            if column.strip().lower() not in names:
+                raise ValueError(f"Column '{column}' not in {path}")
+            index = names.index(column.strip().lower())
+        else:
+            for name in PART_COLUMNS:
+                if name in names:
+                    index = names.index(name)
+                    break
+
+        if index is None:
+            # No recognizable header - the first row is data
+            index = 0
+            if header and header[0].strip():
+                yield header[0].strip()
+
+        for row in reader:
+            if len(row) > index and row[index].strip():
+                yield row[index].strip()
+
+
+class Journal:
+    """Append-only JSONL log of results; finished parts are skipped on restart"""
+
+    def __init__(self, path: str, retry_failed: bool = False):
+        """retry_failed re-runs parts whose journaled result was not a success"""
+        self.path = path
+        self.retry_failed = retry_failed
+        self._lock = threading.Lock()
+        self._done: Set[str] = self._load()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def _load(self) -> Set[str]:
+        done = set()
+        if not os.path.exists(self.path):
+            return done
+
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except ValueError:
+                    continue  # torn last line after a crash
+                key = normalize_key(result['part_number'])
+                if result.get('success') or not self.retry_failed:
+                    done.add(key)
+
+        logger.info(f"📒 Journal {self.path}: {len(done)} parts already done")
+        return done
+
+    def is_done(self, part_number: str) -> bool:
+        return normalize_key(part_number) in self._done
+
+    def pending(self, parts: Iterable[str]) -> Iterator[str]:
+        """Parts not yet journaled (duplicates in the input are dropped too)"""
+        seen = set()
+        for part_number in parts:
+            key = normalize_key(part_number)
+            if key in self._done or key in seen:
+                continue
+            seen.add(key)
+            yield part_number
+
+    def append(self, result: Dict[str, any]):
+        """Durably record one result"""
+        line = json.dumps(result, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._done.add(normalize_key(result['part_number']))
+
+    def close(self):
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,99 @@
+"""
+Offline check + benchmark of the direct lead-time endpoint client:
+capture() -> rebase() -> fetch() against the stub's /api/leadtime
+
+    python benchmarks/bench_leadtime_api.py [--parts 50] [--template recorded.json]
+
+Without --template, capture() is fed the CDP events the lead-time modal
+produces on the live site (a default-quantity XHR, then the one for the
+entered quantity). With --template, a template saved by
+LeadTimeApiClient.save() is loaded instead. Either way the template is
+rebased onto the stub and replayed per part; the exit code is non-zero when
+the parsed rows don't match what the stub served. Needs no browser.
+"""
+from pathlib import Path
+import argparse
+import statistics
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from leadtime_api import LeadTimeApiClient  # noqa: E402
+from stub_server import StubDigikey, start_stub_server  # noqa: E402
+
+LIVE_HOST = "https://www.digikey.de"
+QUANTITY = 9999999
+
+
+def modal_events(product_id: str, quantity: int):
+    """Network.requestWillBeSent events as PerformanceLog.poll() returns them for one modal flow"""
+    def request(url: str, resource_type: str):
+        return ('Network.requestWillBeSent', {
+            'type': resource_type,
+            'request': {'url': url, 'method': 'GET', 'headers': {'Accept': 'application/json'}},
+        })
+
+    return [
+        request(f"{LIVE_HOST}/en/products/detail/analog-devices-inc/AD5412AREZ/{product_id}", 'Document'),
+        request(f"{LIVE_HOST}/api/leadtime?productId={product_id}&qty=1", 'Fetch'),
+        request(f"{LIVE_HOST}/api/leadtime?productId={product_id}&qty={quantity}", 'Fetch'),
+    ]
+
+
+def expected_rows(quantity: int):
+    return [(250, "05.11.2026"), (2500, "19.11.2026"), (10000, "07.01.2027"),
+            (max(quantity - 12750, 1), "18.03.2027")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lead-time API client check against the stub")
+    parser.add_argument("--parts", type=int, default=50)
+    parser.add_argument("--template", help="template saved by LeadTimeApiClient.save()")
+    args = parser.parse_args()
+
+    server = start_stub_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    site = StubDigikey()
+    client = LeadTimeApiClient()
+
+    failed = []
+    latencies = []
+    try:
+        if args.template:
+            client.load(args.template)
+        else:
+            product_id = site.product_id("AD5412AREZ")
+            detail_url = f"{LIVE_HOST}/en/products/detail/analog-devices-inc/AD5412AREZ/{product_id}"
+            if not client.capture(modal_events(product_id, QUANTITY), detail_url, QUANTITY):
+                failed.append("capture() found no lead-time request")
+
+        if client.ready:
+            client.rebase(base_url)
+            print(f"Template: {client.template['method']} {client.template['url']}")
+
+            for i in range(args.parts):
+                product_id = site.product_id(f"BENCH{i:04d}X")
+                start = time.perf_counter()
+                entries = client.fetch(product_id, QUANTITY)
+                latencies.append(time.perf_counter() - start)
+
+                rows = [(entry['qty'], entry['ship_date']) for entry in entries or []]
+                if rows != expected_rows(QUANTITY):
+                    failed.append(f"product {product_id}: got {rows}")
+    finally:
+        client.close()
+        server.shutdown()
+
+    if latencies:
+        print(f"{len(latencies)} fetches  p50={statistics.median(latencies) * 1000:.1f}ms  "
+              f"max={max(latencies) * 1000:.1f}ms")
+
+    if failed:
+        print("❌ " + "; ".join(failed[:5]))
+        sys.exit(1)
+    print("✅ capture -> rebase -> fetch OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Microbenchmark: lead-time date parsing, strptime loop vs. compiled DateParser
+
+    python benchmarks/bench_parse_date.py [--rows 200000] [--distinct 400]
+
+The corpus mimics lead-time tables: mostly one page format per run plus a
+tail of other formats and junk cells, with many repeated dates.
+"""
+from datetime import date, datetime, timedelta
+from pathlib import Path
+import argparse
+import random
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from parsing import DATE_FORMATS, DateParser  # noqa: E402
+
+
+def legacy_parse_date(date_str):
+    """The original strptime loop, for comparison"""
+    if not date_str:
+        return None
+    date_str = date_str.strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).strftime("%d.%m.%Y")
+        except ValueError:
+            continue
+    return None
+
+
+def build_corpus(rows: int, distinct: int, seed: int = 7):
+    rng = random.Random(seed)
+    start = date(2026, 10, 1)
+    days = [start + timedelta(days=rng.randrange(0, 540)) for _ in range(distinct)]
+    page_format = "%d.%m.%Y"
+    other_formats = ["%Y-%m-%d", "%B %d, %Y", "%d %B %Y", "%m/%d/%Y"]
+
+    corpus = []
+    for _ in range(rows):
+        day = rng.choice(days)
+        roll = rng.random()
+        if roll < 0.85:
+            corpus.append(day.strftime(page_format))
+        elif roll < 0.97:
+            corpus.append(day.strftime(rng.choice(other_formats)))
+        else:
+            corpus.append(rng.choice(["Call", "-", "TBD", "Contact us"]))
+    return corpus
+
+
+def run(label: str, parse, corpus):
+    start = time.perf_counter()
+    parsed = [parse(value) for value in corpus]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:>9.1f} ms  {len(corpus) / elapsed / 1000:>8.0f} k rows/s")
+    return parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Date parsing microbenchmark")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--distinct", type=int, default=400)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.rows, args.distinct)
+    print(f"{len(corpus):,} rows, {len(set(corpus)):,} distinct strings\n")
+
+    expected = run("strptime loop (legacy)", legacy_parse_date, corpus)
+    uncached = DateParser(cache_size=0)
+    uncached_result = run("DateParser, no cache", uncached.parse, corpus)
+    cached_result = run("DateParser, cached", DateParser().parse, corpus)
+
+    # Ambiguous m/d vs d/m strings resolve by format order, exactly like the legacy loop
+    mismatches = sum(1 for a, b in zip(expected, cached_result) if a is not None and a != b)
+    assert uncached_result == cached_result
+    print(f"\nRows where legacy parsed a different date: {mismatches}")
+    assert mismatches == 0
+
+
+if __name__ == "__main__":
+    main()
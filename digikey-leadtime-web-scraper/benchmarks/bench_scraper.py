@@ -0,0 +1,125 @@
+"""
+Offline end-to-end benchmark: full DigikeyLeadTimeScraper flow, headless,
+against the local Digi-Key stand-in (benchmarks/stub_server.py)
+
+    python benchmarks/bench_scraper.py [--parts 20] [--in-stock-ratio 0.5]
+                                       [--http-fast-path] [--leadtime-api] [--json out.json]
+                                       [--max-p95 8.0] [--min-parts-per-minute 10]
+
+Reports parts/minute, p50/p95 per-part latency and peak RSS of this process
+plus Chrome/chromedriver. With --max-p95 / --min-parts-per-minute the exit
+code is non-zero when a threshold is missed, so it can gate CI runs.
+--leadtime-api captures the stub's lead-time XHR on the first out-of-stock
+part and replays it for the rest (fails if nothing was captured).
+"""
+from pathlib import Path
+import argparse
+import json
+import statistics
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from leadtime_api import LeadTimeApiClient  # noqa: E402
+from main import DigikeyLeadTimeScraper  # noqa: E402
+from procstats import PeakRssSampler  # noqa: E402
+from stub_server import start_stub_server  # noqa: E402
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def bench_parts(count: int, in_stock_ratio: float):
+    """BENCH0001S... parts; a trailing S makes the stub report them in stock"""
+    in_stock_every = round(1 / in_stock_ratio) if in_stock_ratio > 0 else 0
+    parts = []
+    for i in range(count):
+        in_stock = in_stock_every and i % in_stock_every == 0
+        parts.append(f"BENCH{i:04d}{'S' if in_stock else 'X'}")
+    return parts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline scraper benchmark")
+    parser.add_argument("--parts", type=int, default=20)
+    parser.add_argument("--in-stock-ratio", type=float, default=0.5)
+    parser.add_argument("--http-fast-path", action="store_true")
+    parser.add_argument("--leadtime-api", action="store_true")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--max-p95", type=float, help="fail if p95 latency (s) is above this")
+    parser.add_argument("--min-parts-per-minute", type=float, help="fail if throughput is below this")
+    args = parser.parse_args()
+
+    server = start_stub_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    parts = bench_parts(args.parts, args.in_stock_ratio)
+
+    scraper = DigikeyLeadTimeScraper(
+        headless=not args.headed,
+        http_fast_path=args.http_fast_path,
+        leadtime_api=LeadTimeApiClient() if args.leadtime_api else None,
+        search_url=base_url + "/en/products/result?keywords={}",
+    )
+
+    latencies = []
+    successes = 0
+    try:
+        with PeakRssSampler() as rss:
+            start = time.perf_counter()
+            if not args.http_fast_path:
+                scraper.setup_driver()
+            for part_number in parts:
+                part_start = time.perf_counter()
+                result = scraper.scrape_part(part_number)
+                latencies.append(time.perf_counter() - part_start)
+                successes += 1 if result['success'] else 0
+            elapsed = time.perf_counter() - start
+    finally:
+        scraper.close()
+        server.shutdown()
+
+    report = {
+        'parts': len(parts),
+        'successful': successes,
+        'elapsed_s': round(elapsed, 3),
+        'parts_per_minute': round(len(parts) / elapsed * 60, 2) if elapsed else 0.0,
+        'p50_s': round(statistics.median(latencies), 3) if latencies else 0.0,
+        'p95_s': round(percentile(latencies, 0.95), 3),
+        'peak_rss_mb': round(rss.peak / 1024 / 1024, 1),
+    }
+
+    print("\n" + "=" * 50)
+    print("📊 OFFLINE BENCHMARK")
+    print("=" * 50)
+    for key, value in report.items():
+        print(f"{key:<18} {value}")
+    print("=" * 50)
+    scraper.metrics.log_summary()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+    failed = []
+    if args.max_p95 is not None and report['p95_s'] > args.max_p95:
+        failed.append(f"p95 {report['p95_s']}s > {args.max_p95}s")
+    if args.min_parts_per_minute is not None and report['parts_per_minute'] < args.min_parts_per_minute:
+        failed.append(f"{report['parts_per_minute']} parts/min < {args.min_parts_per_minute}")
+    if args.leadtime_api and not scraper.leadtime_api.ready:
+        failed.append("lead-time API request was never captured")
+    if successes < len(parts):
+        failed.append(f"{len(parts) - successes} parts failed")
+
+    if failed:
+        print("❌ Regression: " + "; ".join(failed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Microbenchmark: lead-time table parsing, full page vs. modal fragment, per backend
+
+    python benchmarks/bench_table_parse.py [--page-mb 3] [--repeat 5]
+
+The saved detail page fixture is padded with filler markup up to --page-mb
+to match the size of a real Digi-Key product page. Memory is the Python heap
+peak from tracemalloc (allocations inside C parsers are not counted).
+The fixture has cells with nested inline markup; every backend must return
+the same rows or the exit code is non-zero.
+"""
+from pathlib import Path
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from table_parsers import available_backends, extract_lead_times  # noqa: E402
+
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+FILLER = (
+    '<div class="product-card"><script>window.__data = {"k": "%s"};</script>'
+    '<table><tr><th>Attr</th><th>Value</th></tr><tr><td>Package</td><td>TSSOP-24</td></tr></table>'
+    '<img src="/img/%d.png"/><p>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p></div>\n'
+)
+
+
+def build_page(page_mb: float) -> str:
+    html = (FIXTURES / "leadtime_detail.html").read_text(encoding="utf-8")
+    target = int(page_mb * 1024 * 1024)
+    chunks = []
+    size = len(html)
+    i = 0
+    while size < target:
+        chunk = FILLER % ("x" * 64, i)
+        chunks.append(chunk)
+        size += len(chunk)
+        i += 1
+    # Filler goes before <main> so the modal stays at the end, like the real page
+    return html.replace("<main>", "".join(chunks) + "<main>", 1)
+
+
+def modal_fragment(html: str) -> str:
+    """Stand-in for querySelector("[role='dialog']").outerHTML"""
+    start = html.index('<div class="MuiPaper-root MuiDialog-paper" role="dialog">')
+    end = html.index("</table>", start) + len("</table>")
+    return html[start:end] + "</div>"
+
+
+def measure(html: str, backend: str, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        entries = extract_lead_times(html, backend)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    extract_lead_times(html, backend)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return entries, statistics.median(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--page-mb", type=float, default=3.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    page = build_page(args.page_mb)
+    fragment = modal_fragment(page)
+
+    print(f"Full page: {len(page) / 1024 / 1024:.2f} MB, modal fragment: {len(fragment) / 1024:.1f} KB")
+    print(f"{'backend':<12} | {'input':<8} | {'median ms':>10} | {'py peak MB':>10} | rows")
+    print("-" * 60)
+
+    rows_by_run = {}
+    for backend in available_backends():
+        for label, html in (("page", page), ("modal", fragment)):
+            entries, median, peak = measure(html, backend, args.repeat)
+            rows_by_run[(backend, label)] = [(e['qty'], e['ship_date']) for e in entries]
+            print(f"{backend:<12} | {label:<8} | {median * 1000:>10.2f} | {peak / 1024 / 1024:>10.2f} | {len(entries)}")
+
+    expected = next(iter(rows_by_run.values()), [])
+    differing = [f"{backend}/{label}" for (backend, label), rows in rows_by_run.items() if rows != expected]
+    if not expected or differing:
+        print(f"❌ Backends disagree on the lead-time rows: {', '.join(differing) or 'no rows parsed'}")
+        sys.exit(1)
+    print(f"✅ All backends parsed the same {len(expected)} rows")
+
+
+if __name__ == "__main__":
+    main()
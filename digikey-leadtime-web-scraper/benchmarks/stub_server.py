@@ -0,0 +1,145 @@
+"""
+Local Digi-Key stand-in for offline benchmarks
+Serves recorded search, detail and lead-time pages (cookie banner, qty input
+with data-testid="lt-input-qty", Update button) plus the lead-time JSON call.
+
+    python benchmarks/stub_server.py [--port 8765]
+
+Parts whose number ends in "S" are in stock, everything else is out of stock.
+Part numbers starting with "MISSING" get a 404.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from string import Template
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+import argparse
+import logging
+import threading
+import zlib
+
+
+logger = logging.getLogger(__name__)
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def _template(name: str) -> Template:
+    return Template((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+class StubDigikey:
+    """Renders stand-in pages for any part number"""
+
+    def __init__(self):
+        self.search = _template("stub_search.html")
+        self.detail = _template("stub_detail.html")
+        self.leadtime = _template("stub_leadtime.json")
+        self.cookie_banner = (FIXTURES / "stub_cookie_banner.html").read_text(encoding="utf-8")
+
+    @staticmethod
+    def product_id(part_number: str) -> str:
+        return str(1000000 + zlib.crc32(part_number.encode()) % 9000000)
+
+    @staticmethod
+    def in_stock(part_number: str) -> bool:
+        return part_number.upper().endswith("S")
+
+    def stock_label(self, part_number: str) -> str:
+        return f"{1234 + len(part_number):,} In Stock" if self.in_stock(part_number) else "0 In Stock"
+
+    def detail_path(self, part_number: str) -> str:
+        return f"/en/products/detail/analog-devices-inc/{quote(part_number)}/{self.product_id(part_number)}"
+
+    def banner(self, cookies: str) -> str:
+        return "" if "OptanonAlertBoxClosed" in cookies else self.cookie_banner
+
+    def render_search(self, part_number: str, cookies: str) -> str:
+        return self.search.substitute(
+            part_number=part_number,
+            detail_path=self.detail_path(part_number),
+            stock_label=self.stock_label(part_number),
+            cookie_banner=self.banner(cookies),
+        )
+
+    def render_detail(self, part_number: str, cookies: str) -> str:
+        return self.detail.substitute(
+            part_number=part_number,
+            product_id=self.product_id(part_number),
+            stock_label=self.stock_label(part_number),
+            cookie_banner=self.banner(cookies),
+        )
+
+    def render_leadtime(self, product_id: str, qty: int) -> str:
+        return self.leadtime.substitute(product_id=product_id, qty=qty, remainder=max(qty - 12750, 1))
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    site = StubDigikey()
+
+    def _send(self, status: int, body: str, content_type: str = "text/html; charset=utf-8"):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _not_found(self):
+        self._send(404, "<html><head><title>404 | DigiKey</title></head><body>Page not found</body></html>")
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        cookies = self.headers.get("Cookie", "")
+
+        if url.path == "/en/products/result":
+            part_number = query.get("keywords", [""])[0]
+            if not part_number or part_number.upper().startswith("MISSING"):
+                return self._not_found()
+            return self._send(200, self.site.render_search(part_number, cookies))
+
+        if url.path.startswith("/en/products/detail/"):
+            segments = url.path.rstrip("/").split("/")
+            if len(segments) < 7:
+                return self._not_found()
+            part_number = unquote(segments[-2])
+            if segments[-1] != self.site.product_id(part_number):
+                return self._not_found()
+            return self._send(200, self.site.render_detail(part_number, cookies))
+
+        if url.path == "/api/leadtime":
+            product_id = query.get("productId", [""])[0]
+            try:
+                qty = int(query.get("qty", ["0"])[0])
+            except ValueError:
+                qty = 0
+            return self._send(200, self.site.render_leadtime(product_id, qty), "application/json")
+
+        return self._not_found()
+
+    def log_message(self, format, *args):
+        logger.debug(f"stub: {format % args}")
+
+
+def start_stub_server(port: int = 0, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Start in a daemon thread; port 0 picks a free port (see server.server_address)"""
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    threading.Thread(target=server.serve_forever, name="stub-digikey", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Digi-Key stand-in")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), StubHandler)
+    print(f"Serving on http://127.0.0.1:{args.port}/en/products/result?keywords=AD5412AREZ")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Persistent scrape_part() result cache (SQLite) with TTL and LRU size limit
+Results are served for stock_ttl at most. Reusing lead-time rows after a
+fresh stock check is delta.py's job, so there is one reuse path.
+"""
+from typing import Dict, Optional
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_key(part_number: str) -> str:
+    """Cache key: upper case, no whitespace"""
+    return re.sub(r'\s+', '', part_number).upper()
+
+
+class ResultCache:
+    """On-disk cache of scrape_part() result dicts keyed by part number"""
+
+    def __init__(self, path: str = "digikey_cache.sqlite3",
+                 stock_ttl: float = 15 * 60,
+                 lead_time_ttl: float = 24 * 3600,
+                 max_entries: int = 100000):
+        """
+        stock_ttl bounds how old a served result (and its stock reading) may be;
+        lead_time_ttl additionally caps results that carry lead-time rows.
+        """
+        self.path = path
+        self.stock_ttl = stock_ttl
+        self.lead_time_ttl = lead_time_ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                has_lead_times INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_lru ON results (last_access)")
+        self._conn.commit()
+
+    def get(self, part_number: str, max_age: Optional[float] = None) -> Optional[Dict[str, any]]:
+        """Cached result if it is younger than stock_ttl (and max_age, if given)"""
+        key = normalize_key(part_number)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, has_lead_times, fetched_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            payload, has_lead_times, fetched_at = row
+            ttl = min(self.stock_ttl, self.lead_time_ttl) if has_lead_times else self.stock_ttl
+            if max_age is not None:
+                ttl = min(ttl, max_age)
+
+            if now - fetched_at > ttl:
+                return None
+
+            self._conn.execute("UPDATE results SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+
+        logger.info(f"💾 Cache hit: {part_number} ({now - fetched_at:.0f}s old)")
+        return json.loads(payload)
+
+    def put(self, result: Dict[str, any]):
+        """Store a successful result, evicting least recently used entries"""
+        if not result.get('success'):
+            return
+
+        key = normalize_key(result['part_number'])
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, payload, has_lead_times, fetched_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(result), 1 if result.get('lead_times') else 0, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        count = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY last_access ASC LIMIT ?)",
+                (excess,)
+            )
+            logger.debug(f"Cache evicted {excess} entries")
+
+    def invalidate(self, part_number: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM results WHERE key = ?", (normalize_key(part_number),))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
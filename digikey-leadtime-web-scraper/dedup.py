@@ -0,0 +1,133 @@
+"""
+Part-number normalization, input dedup and single-flight request coalescing
+Equivalent spellings of one MPN (case, whitespace, packaging suffixes) are
+scraped once and the result is fanned out to every requester.
+"""
+from concurrent.futures import Future, InvalidStateError
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+import logging
+import re
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+# Packaging variants of the same device, stripped from the end of the MPN
+PACKAGING_SUFFIXES = (
+    r'-[126]-ND',            # Digi-Key cut tape / tape & reel / Digi-Reel catalogue numbers
+    r'(?:CT|TR|DKR)?-ND',    # Digi-Key catalogue numbers
+    r'#TRPBF', r'#PBF',      # Linear/ADI lead-free and tape & reel
+    r'-REEL7?', r'-RL7?',    # ADI reels
+    r'[-/]TR',               # generic tape & reel
+)
+
+
+def _suffix_pattern(suffixes: Sequence[str]) -> Pattern:
+    return re.compile(r'(?:' + '|'.join(suffixes) + r')$')
+
+
+_SUFFIX_RE = _suffix_pattern(PACKAGING_SUFFIXES)
+
+
+def canonical_part(part_number: str, suffixes: Optional[Sequence[str]] = None) -> str:
+    """Upper case, no whitespace, packaging suffixes removed ('ad5412arez-reel7 ' -> 'AD5412AREZ')"""
+    if suffixes is None:
+        pattern = _SUFFIX_RE
+    else:
+        pattern = _suffix_pattern(suffixes) if suffixes else None
+
+    part = re.sub(r'\s+', '', part_number).upper()
+    while pattern:
+        stripped = pattern.sub('', part)
+        if stripped == part or not stripped:
+            break
+        part = stripped
+    return part
+
+
+def group_parts(parts: Iterable[str], suffixes: Optional[Sequence[str]] = None) -> Dict[str, List[str]]:
+    """Canonical part -> the input spellings that map to it, in first-seen order"""
+    groups: Dict[str, List[str]] = {}
+    for part_number in parts:
+        groups.setdefault(canonical_part(part_number, suffixes), []).append(part_number)
+
+    total = sum(len(requested) for requested in groups.values())
+    if total > len(groups):
+        logger.info(f"🧹 {total} parts -> {len(groups)} unique after normalization")
+    return groups
+
+
+def result_for(result: Dict[str, any], part_number: str) -> Dict[str, any]:
+    """Copy of a shared result addressed to one requester's spelling"""
+    if result['part_number'] == part_number:
+        return result
+    return dict(result, part_number=part_number)
+
+
+def fan_out(shared: Future, part_number: str) -> Future:
+    """Future that follows `shared`, with the result re-addressed to part_number"""
+    # Left pending (not running) so a cancelled leader can cancel it too
+    follower = Future()
+
+    def forward(done: Future):
+        try:
+            if done.cancelled():
+                follower.cancel()
+            elif done.exception() is not None:
+                follower.set_exception(done.exception())
+            else:
+                follower.set_result(result_for(done.result(), part_number))
+        except InvalidStateError:
+            pass  # the follower itself was cancelled by its caller
+
+    shared.add_done_callback(forward)
+    return follower
+
+
+class SingleFlight:
+    """At most one in-flight scrape per canonical part; later callers share it"""
+
+    def __init__(self, suffixes: Optional[Sequence[str]] = None):
+        self.suffixes = suffixes
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self.coalesced = 0
+
+    def key(self, part_number: str) -> str:
+        return canonical_part(part_number, self.suffixes)
+
+    def join(self, part_number: str) -> Tuple[Future, bool]:
+        """
+        (future, is_leader). The leader must run the scrape and resolve the
+        future; everyone else gets a follower of the leader's future.
+        """
+        key = self.key(part_number)
+        with self._lock:
+            leader = self._inflight.get(key)
+            if leader is not None:
+                self.coalesced += 1
+                logger.debug(f"{part_number}: joining in-flight {key}")
+                return fan_out(leader, part_number), False
+            leader = Future()
+            self._inflight[key] = leader
+
+        leader.add_done_callback(lambda f: self._forget(key, f))
+        return leader, True
+
+    def _forget(self, key: str, future: Future):
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def do(self, part_number: str, fn: Callable[[str], Dict[str, any]]) -> Dict[str, any]:
+        """Blocking form: run fn(part_number) unless an equivalent call is already running"""
+        future, is_leader = self.join(part_number)
+        if is_leader:
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(fn(part_number))
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+        return future.result()
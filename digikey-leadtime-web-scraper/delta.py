@@ -0,0 +1,162 @@
+"""
+Incremental refresh - remembers each part's last result and reports changes
+The cheap signal is a hash of the detail page's lead-time/procurement text
+(parsing.lead_time_fingerprint): when it matches the last run and the stored
+lead times are recent enough, the lead-time modal is skipped and the stored
+rows are reused. Every new result is diffed against the previous one into
+change events (stock went to 0, ship date slipped, ...).
+
+The page text doesn't show every modal date, so a slip that leaves it
+unchanged is reported up to lead_time_max_age later. The scraper asks the
+lead-time API (fresh rows for one request) before reusing anything.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from cache import normalize_key
+
+
+logger = logging.getLogger(__name__)
+
+DATE_FORMAT = "%d.%m.%Y"
+
+
+def _earliest_ship_date(result: Dict[str, any]) -> Optional[datetime]:
+    dates = [datetime.strptime(entry['ship_date'], DATE_FORMAT) for entry in result.get('lead_times') or []]
+    return min(dates) if dates else None
+
+
+def _event(part_number: str, event: str, old, new) -> Dict[str, any]:
+    return {
+        'part_number': part_number,
+        'event': event,
+        'old': old,
+        'new': new,
+        'timestamp': datetime.now().isoformat(),
+    }
+
+
+def diff_results(previous: Optional[Dict[str, any]], current: Dict[str, any]) -> List[Dict[str, any]]:
+    """Change events between two successful results of the same part"""
+    part_number = current['part_number']
+    if previous is None:
+        return [_event(part_number, 'new_part', None, current['current_quantity'])]
+
+    events = []
+    old_qty, new_qty = previous['current_quantity'], current['current_quantity']
+    if previous['in_stock'] and not current['in_stock']:
+        events.append(_event(part_number, 'out_of_stock', old_qty, new_qty))
+    elif current['in_stock'] and not previous['in_stock']:
+        events.append(_event(part_number, 'back_in_stock', old_qty, new_qty))
+    elif old_qty != new_qty:
+        events.append(_event(part_number, 'quantity_changed', old_qty, new_qty))
+
+    old_date, new_date = _earliest_ship_date(previous), _earliest_ship_date(current)
+    if old_date and new_date and old_date != new_date:
+        event = 'ship_date_slipped' if new_date > old_date else 'ship_date_improved'
+        events.append(_event(part_number, event, old_date.strftime(DATE_FORMAT), new_date.strftime(DATE_FORMAT)))
+    elif not current['in_stock'] and previous.get('lead_times') != current.get('lead_times'):
+        events.append(_event(part_number, 'lead_times_changed',
+                             len(previous.get('lead_times') or []), len(current.get('lead_times') or [])))
+
+    return events
+
+
+class DeltaTracker:
+    """Last successful result per part (SQLite), shared by all workers"""
+
+    def __init__(self, path: str = "digikey_baseline.sqlite3", lead_time_max_age: float = 3 * 24 * 3600):
+        """
+        lead_time_max_age: stored lead times older than this are scraped again
+        even when the page fingerprint hasn't changed.
+        """
+        self.path = path
+        self.lead_time_max_age = lead_time_max_age
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS baseline (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                lead_times_at REAL,
+                updated_at REAL NOT NULL,
+                fingerprint TEXT
+            )
+        """)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(baseline)")}
+        if 'fingerprint' not in columns:
+            self._conn.execute("ALTER TABLE baseline ADD COLUMN fingerprint TEXT")
+        self._conn.commit()
+
+    def _row(self, key: str):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT payload, lead_times_at, fingerprint FROM baseline WHERE key = ?", (normalize_key(key),)
+            ).fetchone()
+
+    def get(self, key: str) -> Optional[Dict[str, any]]:
+        row = self._row(key)
+        return json.loads(row[0]) if row else None
+
+    def reusable_lead_times(self, key: str, fingerprint: Optional[str],
+                            max_age: Optional[float] = None) -> Optional[List[Dict[str, any]]]:
+        """
+        Stored lead times if the page fingerprint matches the last run and they
+        are younger than lead_time_max_age (and max_age), else None (scrape them).
+        key is the part number, or a per-site key like scraper.index_key().
+        """
+        row = self._row(key) if fingerprint else None
+        if row is None:
+            return None
+
+        previous, lead_times_at, previous_fingerprint = json.loads(row[0]), row[1], row[2]
+        if not previous.get('lead_times') or lead_times_at is None or previous_fingerprint != fingerprint:
+            return None
+        max_age = self.lead_time_max_age if max_age is None else min(self.lead_time_max_age, max_age)
+        if time.time() - lead_times_at > max_age:
+            return None
+
+        return previous['lead_times']
+
+    def update(self, result: Dict[str, any], lead_times_reused: bool = False,
+               key: Optional[str] = None, fingerprint: Optional[str] = None) -> List[Dict[str, any]]:
+        """Store a successful result (and its page fingerprint) as the new baseline, returns its change events"""
+        if not result.get('success'):
+            return []
+
+        key = normalize_key(key or result['part_number'])
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, lead_times_at FROM baseline WHERE key = ?", (key,)
+            ).fetchone()
+            previous = json.loads(row[0]) if row else None
+
+            # Reused rows keep their original age so they are refreshed eventually
+            if lead_times_reused and row:
+                lead_times_at = row[1]
+            else:
+                lead_times_at = now if result.get('lead_times') else None
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO baseline (key, payload, lead_times_at, updated_at, fingerprint) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(result), lead_times_at, now, fingerprint)
+            )
+            self._conn.commit()
+
+        events = diff_results(previous, result)
+        for event in events:
+            if event['event'] != 'new_part':
+                logger.info(f"🔔 {event['part_number']}: {event['event']} ({event['old']} → {event['new']})")
+        return events
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
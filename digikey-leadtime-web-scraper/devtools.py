@@ -0,0 +1,47 @@
+"""
+Chrome DevTools performance-log reader
+Needs the driver started with goog:loggingPrefs {"performance": "ALL"}.
+"""
+from typing import Callable, Dict, List, Tuple
+import json
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class PerformanceLog:
+    """Drains driver.get_log('performance') and hands CDP events to listeners"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._listeners: List[Callable[[str, Dict], None]] = []
+
+    def add_listener(self, listener: Callable[[str, Dict], None]):
+        """listener(method, params) is called for every CDP event polled"""
+        self._listeners.append(listener)
+
+    def poll(self) -> List[Tuple[str, Dict]]:
+        """Read all buffered events (the driver clears its buffer on read)"""
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            logger.debug(f"Performance log unavailable: {e}")
+            return []
+
+        events = []
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError, TypeError):
+                continue
+            method = message.get('method', '')
+            params = message.get('params', {})
+            events.append((method, params))
+            for listener in self._listeners:
+                try:
+                    listener(method, params)
+                except Exception as e:
+                    logger.debug(f"Performance listener error: {e}")
+
+        return events
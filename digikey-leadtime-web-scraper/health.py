@@ -0,0 +1,73 @@
+"""
+Driver health checks - decides when a long-running Chrome should be recycled
+"""
+from collections import deque
+from typing import Deque, Optional
+import logging
+import statistics
+
+from procstats import process_tree_rss
+
+
+logger = logging.getLogger(__name__)
+
+
+class DriverHealthMonitor:
+    """Tracks parts, failures, page-load latency and RSS for one driver (one per scraper)"""
+
+    def __init__(self,
+                 recycle_every: int = 250,
+                 max_rss_mb: float = 3000,
+                 max_consecutive_failures: int = 3,
+                 latency_window: int = 20,
+                 latency_factor: float = 2.5):
+        """
+        Recycle after recycle_every parts, when Chrome's process tree exceeds
+        max_rss_mb, after max_consecutive_failures failed parts, or when the
+        median page load of the last latency_window loads is latency_factor
+        times slower than right after the driver started. 0 disables a check.
+        """
+        self.recycle_every = recycle_every
+        self.max_rss_mb = max_rss_mb
+        self.max_consecutive_failures = max_consecutive_failures
+        self.latency_window = latency_window
+        self.latency_factor = latency_factor
+        self.restarts = 0
+        self.reset()
+
+    def reset(self):
+        """Call after every driver (re)start"""
+        self.parts = 0
+        self.consecutive_failures = 0
+        self._baseline: Optional[float] = None
+        self._latencies: Deque[float] = deque(maxlen=max(1, self.latency_window))
+
+    def record_page_load(self, seconds: float):
+        self._latencies.append(seconds)
+        if self._baseline is None and len(self._latencies) == self._latencies.maxlen:
+            self._baseline = statistics.median(self._latencies)
+            logger.debug(f"Page-load baseline: {self._baseline:.2f}s")
+
+    def record_part(self, success: bool):
+        self.parts += 1
+        self.consecutive_failures = 0 if success else self.consecutive_failures + 1
+
+    def recycle_reason(self, browser_pid: Optional[int] = None) -> Optional[str]:
+        """Why the driver should be restarted now, or None if it's healthy"""
+        if self.recycle_every and self.parts >= self.recycle_every:
+            return f"{self.parts} parts since start"
+
+        if self.max_consecutive_failures and self.consecutive_failures >= self.max_consecutive_failures:
+            return f"{self.consecutive_failures} failed parts in a row"
+
+        if self.latency_factor and self._baseline:
+            current = statistics.median(self._latencies)
+            if current > self._baseline * self.latency_factor:
+                return f"page loads slowed to {current:.1f}s (baseline {self._baseline:.1f}s)"
+
+        if self.max_rss_mb and browser_pid:
+            rss_mb = process_tree_rss(browser_pid) / 1024 / 1024
+            if rss_mb > self.max_rss_mb:
+                return f"Chrome RSS {rss_mb:.0f} MB > {self.max_rss_mb:.0f} MB"
+
+        return None
@@ -0,0 +1,126 @@
+"""
+HTTP-only fast path - checks stock without starting a browser
+"""
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
+from urllib.parse import urljoin
+import logging
+import re
+import requests
+
+from parsing import is_challenge_page, parse_stock_text
+from rate_limit import AdaptiveRateLimiter
+from regions import Region
+
+
+logger = logging.getLogger(__name__)
+
+
+class FetchBlocked(Exception):
+    """Raised when Digi-Key answers with a block or bot challenge"""
+    pass
+
+
+class HttpStockFetcher:
+    """Pooled requests.Session that fetches search/detail HTML and parses stock"""
+
+    BLOCK_STATUS = (401, 403, 429, 503)
+
+    DETAIL_LINK_RE = re.compile(r'href="([^"]*/products/detail/[^"]+)"', re.IGNORECASE)
+
+    def __init__(self, search_url: str, user_agent: Optional[str] = None,
+                 timeout: float = 15, pool_size: int = 10,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 region: Optional[Region] = None):
+        self.search_url = search_url
+        self.region = region
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": region.accept_language if region else "en-US,en;q=0.9,de;q=0.8",
+        })
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+
+    def _get(self, url: str) -> requests.Response:
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.Timeout:
+            if self.rate_limiter:
+                self.rate_limiter.record_failure("timeout")
+            raise
+
+        if response.status_code in self.BLOCK_STATUS:
+            if self.rate_limiter:
+                self.rate_limiter.record_failure(f"HTTP {response.status_code}")
+            raise FetchBlocked(f"HTTP {response.status_code}")
+
+        if is_challenge_page(response.text):
+            if self.rate_limiter:
+                self.rate_limiter.record_failure("challenge")
+            raise FetchBlocked("Challenge page")
+
+        if self.rate_limiter:
+            self.rate_limiter.record_success()
+        return response
+
+    def find_detail_url(self, html: str, base_url: str, part_number: str) -> Optional[str]:
+        """Pick the detail link for part_number out of search results HTML"""
+        links = self.DETAIL_LINK_RE.findall(html)
+        if not links:
+            return None
+
+        part_lower = part_number.lower()
+        for link in links:
+            if part_lower in link.lower():
+                return urljoin(base_url, link)
+
+        return urljoin(base_url, links[0])
+
+    def fetch_stock(self, part_number: str) -> Optional[Dict[str, any]]:
+        """
+        Return parse_stock_text() dict plus 'detail_url', or None when the
+        page is blocked or can't be resolved - callers fall back to Selenium.
+        """
+        try:
+            url = self.search_url.format(part_number)
+            response = self._get(url)
+
+            # Exact matches redirect straight to the detail page
+            if "/products/detail/" not in response.url:
+                detail_url = self.find_detail_url(response.text, response.url, part_number)
+                if not detail_url:
+                    logger.info(f"ℹ️ HTTP: no detail link for {part_number}")
+                    return None
+                response = self._get(detail_url)
+
+            page_text = response.text.lower()
+            if part_number.lower() not in page_text:
+                logger.info(f"ℹ️ HTTP: {part_number} not on detail page")
+                return None
+
+            if self.region:
+                stock = parse_stock_text(page_text, self.region.in_stock_phrases, self.region.out_of_stock_phrases)
+            else:
+                stock = parse_stock_text(page_text)
+            stock['detail_url'] = response.url
+            return stock
+
+        except FetchBlocked as e:
+            logger.warning(f"⚠️ HTTP fetch blocked: {e}")
+            return None
+        except requests.RequestException as e:
+            logger.warning(f"⚠️ HTTP fetch failed: {e}")
+            return None
+
+    def close(self):
+        self.session.close()
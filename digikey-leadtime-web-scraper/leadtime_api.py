@@ -0,0 +1,219 @@
+"""
+Direct lead-time endpoint client
+Captures the XHR the lead-time modal sends (from Chrome performance logs)
+and replays it per part with the qty parameter, skipping the modal UI.
+"""
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+import json
+import logging
+import os
+import re
+import requests
+
+from parsing import parse_date
+
+
+logger = logging.getLogger(__name__)
+
+QTY_TOKEN = "__QTY__"
+PRODUCT_ID_TOKEN = "__PRODUCT_ID__"
+
+# Request headers that must not be replayed verbatim
+_SKIP_HEADERS = {"content-length", "host", "cookie", ":authority", ":method", ":path", ":scheme"}
+
+
+def product_id_from_url(detail_url: str) -> Optional[str]:
+    """Digi-Key detail URLs end in /{manufacturer}/{mpn}/{product_id}"""
+    path = urlsplit(detail_url).path.rstrip('/')
+    last = path.rsplit('/', 1)[-1]
+    return last if last.isdigit() else None
+
+
+class LeadTimeApiClient:
+    """
+    Replays the recorded lead-time XHR with a new product id and quantity.
+    Without a loaded template the scraper captures one from its first modal run.
+    """
+
+    URL_PATTERNS = ("leadtime", "lead-time", "lead_time")
+
+    QTY_KEYS = ("qty", "quantity")
+    DATE_KEYS = ("shipdate", "ship_date", "date", "estimatedshipdate")
+
+    def __init__(self, template: Optional[Dict[str, any]] = None, timeout: float = 15,
+                 session: Optional[requests.Session] = None, template_path: Optional[str] = None):
+        """
+        template: {'method', 'url', 'headers', 'body'} with QTY/PRODUCT_ID tokens.
+        template_path is loaded if it exists and written after a capture, so
+        later runs skip the modal from their first part on.
+        """
+        self.template = template
+        self.timeout = timeout
+        self.template_path = template_path
+        if template is None and template_path and os.path.exists(template_path):
+            try:
+                self.load(template_path)
+                logger.info(f"🛰️ Loaded lead-time endpoint from {template_path}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ Ignoring unreadable lead-time template {template_path}: {e}")
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    @property
+    def ready(self) -> bool:
+        return self.template is not None
+
+    def matches(self, url: str) -> bool:
+        url_lower = url.lower()
+        return any(pattern in url_lower for pattern in self.URL_PATTERNS)
+
+    def capture(self, events, detail_url: str, quantity: int, cookies: Optional[List[Dict]] = None) -> bool:
+        """
+        Look for the lead-time request among CDP events from PerformanceLog.poll()
+        and turn it into a template. cookies are the driver's get_cookies().
+        The modal may fire several matching XHRs (an initial load, then the one
+        for the entered quantity), so the last one carrying the quantity wins.
+        """
+        product_id = product_id_from_url(detail_url)
+        qty_str = str(quantity)
+
+        candidates = []
+        for method, params in events:
+            if method != 'Network.requestWillBeSent':
+                continue
+            request = params.get('request', {})
+            if self.matches(request.get('url', '')) and params.get('type') in ('XHR', 'Fetch'):
+                candidates.append(request)
+
+        if not candidates:
+            return False
+
+        with_qty = [r for r in candidates if qty_str in r.get('url', '') or qty_str in (r.get('postData') or '')]
+        request = (with_qty or candidates)[-1]
+
+        def tokenize(text: Optional[str]) -> Optional[str]:
+            if text is None:
+                return None
+            text = text.replace(qty_str, QTY_TOKEN)
+            if product_id:
+                text = text.replace(product_id, PRODUCT_ID_TOKEN)
+            return text
+
+        headers = {
+            name: value for name, value in request.get('headers', {}).items()
+            if name.lower() not in _SKIP_HEADERS
+        }
+        self.template = {
+            'method': request.get('method', 'GET'),
+            'url': tokenize(request['url']),
+            'headers': headers,
+            'body': tokenize(request.get('postData')),
+        }
+
+        for cookie in cookies or []:
+            self.session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+
+        if not with_qty:
+            logger.warning(f"⚠️ Lead-time request doesn't carry qty {qty_str}, replays will ignore the quantity")
+        logger.info(f"🛰️ Captured lead-time endpoint: {self.template['method']} {self.template['url']}")
+        if self.template_path:
+            try:
+                self.save(self.template_path)
+            except OSError as e:
+                logger.warning(f"⚠️ Could not save lead-time template {self.template_path}: {e}")
+        return True
+
+    def save(self, path: str):
+        """Record the template (e.g. for replaying against a stub server)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.template, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str):
+        with open(path, encoding='utf-8') as f:
+            self.template = json.load(f)
+
+    def rebase(self, base_url: str):
+        """Point the template at another scheme/host, e.g. http://127.0.0.1:8000"""
+        base = urlsplit(base_url)
+        url = urlsplit(self.template['url'])
+        self.template['url'] = urlunsplit((base.scheme, base.netloc, url.path, url.query, url.fragment))
+
+    def fetch(self, product_id: str, quantity: int = 9999999) -> Optional[List[Dict[str, any]]]:
+        """
+        Return lead-time entries in extract_table() shape, or None when the
+        request fails - callers fall back to the modal flow.
+        """
+        if not self.template:
+            return None
+
+        def fill(text: Optional[str]) -> Optional[str]:
+            if text is None:
+                return None
+            return text.replace(QTY_TOKEN, str(quantity)).replace(PRODUCT_ID_TOKEN, str(product_id))
+
+        try:
+            response = self.session.request(
+                self.template['method'],
+                fill(self.template['url']),
+                headers=self.template.get('headers'),
+                data=fill(self.template.get('body')),
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            payload = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"⚠️ Lead-time API failed: {e}")
+            return None
+
+        entries = self.parse_payload(payload)
+        logger.info(f"🛰️ Lead-time API returned {len(entries)} entries")
+        return entries
+
+    def parse_payload(self, payload) -> List[Dict[str, any]]:
+        """Find qty/date rows anywhere in the JSON payload"""
+        entries = []
+
+        def key_of(row: Dict, names) -> Optional[str]:
+            for key in row:
+                if re.sub(r'[^a-z_]', '', key.lower()) in names:
+                    return key
+            return None
+
+        def walk(node):
+            if isinstance(node, dict):
+                qty_key = key_of(node, self.QTY_KEYS)
+                date_key = key_of(node, self.DATE_KEYS)
+                if qty_key and date_key:
+                    try:
+                        qty = int(re.sub(r'[^\d]', '', str(node[qty_key])))
+                    except ValueError:
+                        qty = 0
+                    date_text = str(node[date_key]).split('T')[0]
+                    ship_date = parse_date(date_text)
+                    if qty > 0 and ship_date:
+                        entries.append({
+                            'qty': qty,
+                            'ship_date': ship_date,
+                            'raw_text': f"QTY: {qty}, Date: {date_text}"
+                        })
+                    return
+                for value in node.values():
+                    walk(value)
+            elif isinstance(node, list):
+                for value in node:
+                    walk(value)
+
+        walk(payload)
+        return entries
+
+    def close(self):
+        self.session.close()
@@ -7,15 +7,38 @@ import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
 import time
 import random
+from concurrent.futures import as_completed
 from datetime import datetime
 from typing import Dict, List, Optional
+import argparse
 import logging
-import re
+import os
 
+from batch import Journal, read_parts
+from cache import ResultCache
+from dedup import group_parts, result_for
+from delta import DeltaTracker
+from devtools import PerformanceLog
+from health import DriverHealthMonitor
+from http_fetch import HttpStockFetcher
+from leadtime_api import LeadTimeApiClient, product_id_from_url
+from metrics import StageMetrics, start_metrics_server
+from parsing import is_challenge_page, lead_time_fingerprint, parse_stock_text, quantity_matches
+from pool import ScraperPool
+from profiles import has_consent_cookie, load_cookie_jar, save_cookie_jar, worker_profile_dir
+from rate_limit import AdaptiveRateLimiter
+from records import ResultStore
+from regions import DEFAULT_REGION, REGIONS, MultiRegionScraper, Region, get_region
+from resource_blocking import ResourceBlocker
+from selector_registry import SelectorRegistry
+from sinks import JsonlSink, open_sink
+from snapshot import PageSnapshot
+from table_parsers import extract_lead_times
+from url_index import DetailUrlIndex
+from waits import PageWaiter, StepStats
 
 
 logging.basicConfig(
@@ -25,6 +48,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# React tracks an input's value through the prototype setter, so assigning
+# .value directly is ignored; call the native setter and dispatch the events
+# a real keystroke would, then blur like the TAB the typing path sends.
+_SET_INPUT_VALUE_JS = """
+var input = arguments[0];
+var setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+input.focus();
+setter.call(input, arguments[1]);
+input.dispatchEvent(new Event('input', {bubbles: true}));
+input.dispatchEvent(new Event('change', {bubbles: true}));
+input.blur();
+"""
+
+
 
 class DigikeyScraperError(Exception):
     """Custom exception for Digikey scraper errors"""
@@ -42,16 +79,81 @@ class DigikeyLeadTimeScraper:
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     ]
     
-    def __init__(self, headless: bool = False, timeout: int = 15):
-        """Initialize scraper"""
+    LEAD_TIME_QTY = 9999999
+    
+    # How long the best-ranked selector has to itself before fallbacks may match
+    SELECTOR_GRACE = 2.0
+    
+    MODAL_SELECTORS = [
+        "[role='dialog']",
+        ".MuiDialog-root",
+        ".MuiModal-root",
+    ]
+    
+    def __init__(self, headless: bool = False, timeout: int = 15,
+                 wait_stats: Optional[StepStats] = None,
+                 http_fast_path: bool = False,
+                 leadtime_api: Optional[LeadTimeApiClient] = None,
+                 cache: Optional[ResultCache] = None,
+                 url_index: Optional[DetailUrlIndex] = None,
+                 table_backend: Optional[str] = None,
+                 profile_dir: Optional[str] = None,
+                 cookie_jar: Optional[str] = None,
+                 resource_blocker: Optional[ResourceBlocker] = None,
+                 metrics: Optional[StageMetrics] = None,
+                 search_url: Optional[str] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 health_monitor: Optional[DriverHealthMonitor] = None,
+                 region: Optional[Region] = None,
+                 bulk_input: bool = True,
+                 selectors: Optional[SelectorRegistry] = None,
+                 delta: Optional[DeltaTracker] = None):
+        """
+        Initialize scraper; each option is documented with the class it takes.
+        Shared helpers (stats, metrics, limiter, cache, index, selectors, delta)
+        are not closed by close().
+        search_url overrides SEARCH_URL, e.g. to point at a local stand-in server.
+        """
+        self.region = region or get_region(DEFAULT_REGION)
+        if search_url:
+            self.SEARCH_URL = search_url
+        elif region:
+            self.SEARCH_URL = region.search_url
+        self.date_parser = self.region.date_parser()
         self.headless = headless
         self.timeout = timeout
         self.driver = None
+        self.closed = False
         self.wait = None
+        self.waiter = None
+        self.wait_stats = wait_stats or StepStats()
         self.cookies_accepted = False
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        self.health = health_monitor or DriverHealthMonitor()
+        self._snapshot = None
+        self.leadtime_api = leadtime_api
+        self.cache = cache
+        self.url_index = url_index
+        self.table_backend = table_backend
+        self.bulk_input = bulk_input
+        self.selectors = selectors or SelectorRegistry()
+        self.delta = delta
+        self.profile_dir = profile_dir
+        self.cookie_jar = cookie_jar
+        self.resource_blocker = resource_blocker
+        self.metrics = metrics or StageMetrics()
+        self.perf_log = None
+        self.http_fetcher = None
+        if http_fast_path:
+            self.http_fetcher = HttpStockFetcher(self.SEARCH_URL, user_agent=random.choice(self.USER_AGENTS),
+                                                 timeout=timeout, rate_limiter=self.rate_limiter,
+                                                 region=self.region)
         
     def setup_driver(self):
         """Initialize Chrome driver - NO STEALTH for Chrome 144+"""
+        if self.closed:
+            raise DigikeyScraperError("Scraper is closed")
+        
         try:
             options = uc.ChromeOptions()
             
@@ -67,32 +169,62 @@ class DigikeyLeadTimeScraper:
             user_agent = random.choice(self.USER_AGENTS)
             options.add_argument(f"user-agent={user_agent}")
             
+            if self.leadtime_api or self.resource_blocker:
+                options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            
             # ✅ UC 3.5.5 САМ обходить всі детекції!
-            self.driver = uc.Chrome(options=options, version_main=None)
+            self.driver = uc.Chrome(options=options, version_main=None, user_data_dir=self.profile_dir)
+            if self.closed:
+                # close() ran from another thread while Chrome was starting
+                self.quit_driver()
+                raise DigikeyScraperError("Scraper is closed")
             self.driver.set_page_load_timeout(120)
             
+            if self.cookie_jar:
+                load_cookie_jar(self.driver, self.cookie_jar)
+            
             # NO STEALTH! UC 3.5.5 вже стелс!
             
             self.wait = WebDriverWait(self.driver, self.timeout)
+            self.waiter = PageWaiter(self.driver, self.timeout, stats=self.wait_stats)
+            if self.leadtime_api or self.resource_blocker:
+                self.perf_log = PerformanceLog(self.driver)
+            if self.resource_blocker:
+                self.resource_blocker.install(self.driver)
+                self.perf_log.add_listener(self.resource_blocker.on_event)
             logger.info("✅ Driver initialized")
             
         except Exception as e:
             logger.error(f"❌ Driver init failed: {str(e)}")
             raise DigikeyScraperError(f"Driver initialization failed: {str(e)}")
     
+    def warm_up(self):
+        """Start Chrome and clear the cookie banner before the first part arrives"""
+        if self.driver is None:
+            self.metrics.track("setup_driver", self.setup_driver, ok=lambda r: True)
+        home_url = self.SEARCH_URL.split("/products/")[0]
+        try:
+            if self.load_page(home_url, "warm_up.loaded"):
+                self.metrics.track("accept_cookies", self.accept_cookies)
+                logger.info("🔥 Driver warmed up")
+        except Exception as e:
+            logger.warning(f"⚠️ Warm-up page failed: {str(e)}")
+    
     def accept_cookies(self):
         """Accept cookies and close privacy banners"""
         if self.cookies_accepted:
             return True
+        
+        if (self.profile_dir or self.cookie_jar) and has_consent_cookie(self.driver):
+            logger.info("🍪 Consent cookie present, skipping banner")
+            self.cookies_accepted = True
+            return True
             
         try:
             logger.info("🍪 Looking for cookie banner...")
             
-            # ✅ OPTIMIZED: Reduced from 2s to 0.5s
-            time.sleep(0.5)
-            
             # Multiple selectors for cookie accept buttons
-            cookie_selectors = [
+            cookie_selectors = list(self.region.cookie_selectors) + [
                 "//button[contains(text(), 'Accept')]",
                 "//button[contains(text(), 'Accept All')]",
                 "//button[contains(text(), 'Akzeptieren')]",
@@ -105,19 +237,16 @@ class DigikeyLeadTimeScraper:
                 "//button[contains(., 'I Accept')]"
             ]
             
-            for selector in cookie_selectors:
-                try:
-                    # ✅ OPTIMIZED: Reduced timeout from 3s to 2s
-                    button = WebDriverWait(self.driver, 2).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    button.click()
-                    self.cookies_accepted = True
-                    logger.info("✅ Accepted cookies")
-                    time.sleep(0.3)  # ✅ OPTIMIZED: Reduced from 1s
-                    return True
-                except:
-                    continue
+            # One 2s race over all candidates instead of 2s per selector
+            button = self.find_first("accept_cookies", cookie_selectors, timeout=2, clickable=True)
+            if button is not None:
+                button.click()
+                self.invalidate_snapshot()
+                self.cookies_accepted = True
+                logger.info("✅ Accepted cookies")
+                self.waiter.until("accept_cookies.banner_closed", EC.invisibility_of_element(button),
+                                  timeout=2, replaces=0.3, required=False)
+                return True
             
             logger.info("ℹ️ No cookie banner found")
             self.cookies_accepted = True
@@ -128,6 +257,41 @@ class DigikeyLeadTimeScraper:
             self.cookies_accepted = True
             return True
     
+    def find_first(self, group: str, selectors: List[str], timeout: float,
+                   clickable: bool = False, **params):
+        """
+        First element matched by any XPath in selectors (None on timeout).
+        Candidates are tried best-first by past hit rate and all of them are
+        checked on every poll, but lower-ranked ones only win once the best
+        one has been missing for SELECTOR_GRACE (at most half the timeout), so
+        a stale selector costs the grace period instead of a full timeout.
+        {placeholders} are filled from params after ranking.
+        """
+        ranked = self.selectors.rank(group, selectors)
+        xpaths = [selector.format(**params) for selector in ranked] if params else ranked
+        start = time.perf_counter()
+        found = self.waiter.first(f"{group}.find", xpaths, timeout=timeout, clickable=clickable,
+                                  grace=min(self.SELECTOR_GRACE, timeout / 2))
+        elapsed = time.perf_counter() - start
+        
+        winner = ranked[found[0]] if found else None
+        self.selectors.record_lookup(group, ranked, winner, elapsed)
+        if found:
+            logger.debug(f"{group}: matched {winner} in {elapsed:.2f}s")
+            return found[1]
+        return None
+    
+    @property
+    def snapshot(self) -> PageSnapshot:
+        """DOM snapshot of the current page, pulled once until invalidated"""
+        if self._snapshot is None:
+            self._snapshot = PageSnapshot(self.driver)
+        return self._snapshot
+    
+    def invalidate_snapshot(self):
+        """Call after anything that navigates or changes the page"""
+        self._snapshot = None
+    
     def human_delay(self, min_sec: float = 0.5, max_sec: float = 1.5):
         """Optimized random delay"""
         time.sleep(random.uniform(min_sec, max_sec))
@@ -135,11 +299,35 @@ class DigikeyLeadTimeScraper:
     def scroll_to(self, element):
         """Scroll to element"""
         try:
-            self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-            time.sleep(0.3)  # ✅ OPTIMIZED: Reduced from 0.5-1.5s
+            # Instant scroll - no animation to wait for
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
         except Exception as e:
             logger.debug(f"Scroll error: {str(e)}")
     
+    def load_page(self, url: str, step: str) -> bool:
+        """Rate-limited driver.get(); False (and a backoff) on a challenge page"""
+        self.rate_limiter.acquire()
+        self.invalidate_snapshot()
+        
+        start = time.perf_counter()
+        try:
+            self.driver.get(url)
+        except TimeoutException:
+            self.health.record_page_load(time.perf_counter() - start)
+            self.rate_limiter.record_failure("timeout")
+            raise
+        self.health.record_page_load(time.perf_counter() - start)
+        
+        self.waiter.document_ready(step, replaces=1.0)
+        
+        if is_challenge_page(self.snapshot.html_lower):
+            logger.warning("⚠️ Challenge page")
+            self.rate_limiter.record_failure("challenge")
+            return False
+        
+        self.rate_limiter.record_success()
+        return True
+    
     def search_part(self, part_number: str) -> bool:
         """Search for part number"""
         try:
@@ -148,36 +336,27 @@ class DigikeyLeadTimeScraper:
             url = self.SEARCH_URL.format(part_number)
             logger.info(f"📍 URL: {url}")
             
+            # Retry pacing comes from the rate limiter's backoff
             for attempt in range(3):
                 try:
-                    self.driver.get(url)
-                    break
+                    if self.load_page(url, "search_part.loaded"):
+                        break
                 except TimeoutException:
                     logger.warning(f"⚠️ Timeout attempt {attempt + 1}/3")
-                    if attempt < 2:
-                        time.sleep(2)  # ✅ OPTIMIZED: Reduced from 5s
-                    else:
-                        return False
                 except Exception as e:
                     logger.error(f"⚠️ Navigate error attempt {attempt + 1}/3: {e}")
-                    if attempt < 2:
-                        time.sleep(2)
-                    else:
-                        return False
-            
-            time.sleep(1)  # ✅ OPTIMIZED: Reduced from 3-5s
-            
-            self.accept_cookies()
+                    self.rate_limiter.record_failure("error")
+                if attempt == 2:
+                    return False
             
-            time.sleep(0.5)  # ✅ OPTIMIZED: Reduced from 2-3s
+            self.metrics.track("accept_cookies", self.accept_cookies)
             
-            logger.info(f"📄 Page: {self.driver.title}")
+            logger.info(f"📄 Page: {self.snapshot.title}")
             
             try:
                 self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
                 
-                page_source = self.driver.page_source.lower()
-                if "404" in self.driver.title or "not found" in page_source:
+                if "404" in self.snapshot.title or "not found" in self.snapshot.html_lower:
                     logger.error("❌ 404 page")
                     return False
                 
@@ -192,16 +371,35 @@ class DigikeyLeadTimeScraper:
             logger.error(f"❌ Search error: {str(e)}")
             return False
     
+    def open_detail_page(self, part_number: str, url: str) -> bool:
+        """Open a known detail URL directly, invalidating it if it's gone"""
+        try:
+            logger.info(f"🔗 Opening known detail page: {url}")
+            if not self.load_page(url, "open_detail_page.loaded"):
+                return False
+            self.metrics.track("accept_cookies", self.accept_cookies)
+            
+            snapshot = self.snapshot
+            if ("404" in snapshot.title or "not found" in snapshot.html_lower
+                    or "/products/detail/" not in snapshot.url
+                    or part_number.lower() not in snapshot.html_lower):
+                logger.warning("⚠️ Known detail URL is stale")
+                if self.url_index:
+                    self.url_index.invalidate(self.index_key(part_number))
+                return False
+            
+            return True
+            
+        except Exception as e:
+            logger.warning(f"⚠️ Detail page open failed: {str(e)}")
+            return False
+    
     def navigate_to_product(self, part_number: str) -> bool:
         """Navigate to product page"""
         try:
             logger.info(f"🔎 Finding product: {part_number}")
-            time.sleep(0.5)  # ✅ OPTIMIZED: Reduced from 2-3s
             
-            page_source = self.driver.page_source.lower()
-            current_url = self.driver.current_url
-            
-            if "/products/detail/" in current_url and part_number.lower() in page_source:
+            if "/products/detail/" in self.snapshot.url and part_number.lower() in self.snapshot.html_lower:
                 logger.info("✅ Already on product detail page")
                 return True
             
@@ -209,52 +407,35 @@ class DigikeyLeadTimeScraper:
             
             try:
                 self.driver.execute_script("window.scrollBy(0, 300);")
-                time.sleep(0.5)  # ✅ OPTIMIZED: Reduced from 1-2s
+                self.waiter.element("navigate_to_product.results",
+                                    (By.XPATH, "//a[contains(@href, '/products/detail/')]"),
+                                    replaces=1.0, required=False)
                 
                 link_selectors = [
-                    f"//a[contains(@href, '/products/detail/') and contains(., '{part_number}')]",
-                    f"//td[contains(., '{part_number}')]//ancestor::tr//a[contains(@href, '/products/detail/')]",
+                    "//a[contains(@href, '/products/detail/') and contains(., '{part_number}')]",
+                    "//td[contains(., '{part_number}')]//ancestor::tr//a[contains(@href, '/products/detail/')]",
                     "//table[@id='productTable']//a[contains(@href, '/products/detail/')]",
                     "//table//tr//td[1]//a[contains(@href, '/products/detail/')]"
                 ]
                 
-                product_link = None
-                for selector in link_selectors:
-                    try:
-                        elements = self.driver.find_elements(By.XPATH, selector)
-                        logger.info(f"Found {len(elements)} elements with selector")
-                        
-                        for elem in elements:
-                            try:
-                                elem_text = elem.text.upper()
-                                elem_href = elem.get_attribute('href')
-                                
-                                logger.info(f"Checking element: {elem_text[:30]}")
-                                
-                                if part_number.upper() in elem_text or '/products/detail/' in elem_href:
-                                    product_link = elem
-                                    logger.info(f"✅ Found matching link: {elem_text[:50]}")
-                                    break
-                            except:
-                                continue
-                                
-                        if product_link:
-                            break
-                    except Exception as e:
-                        logger.debug(f"Selector failed: {selector} - {e}")
-                        continue
+                product_link = self.find_first("navigate_to_product", link_selectors, timeout=1,
+                                               part_number=part_number)
+                if product_link:
+                    logger.info(f"✅ Found matching link: {product_link.text[:50]}")
                 
                 if product_link:
                     self.scroll_to(product_link)
-                    time.sleep(0.3)  # ✅ OPTIMIZED: Reduced from 1-2s
                     
                     logger.info(f"Clicking link: {product_link.get_attribute('href')}")
                     self.driver.execute_script("arguments[0].click();", product_link)
+                    self.invalidate_snapshot()
                     
-                    time.sleep(2) 
+                    self.waiter.until("navigate_to_product.detail", EC.url_contains("/products/detail/"),
+                                      replaces=2.3, required=False)
+                    self.waiter.document_ready("navigate_to_product.loaded")
                     logger.info("✅ Clicked product link")
                     
-                    new_url = self.driver.current_url
+                    new_url = self.snapshot.url
                     if "/products/detail/" in new_url:
                         logger.info(f"✅ Successfully navigated to: {new_url}")
                         return True
@@ -278,46 +459,15 @@ class DigikeyLeadTimeScraper:
         try:
             logger.info("📦 Checking stock...")
             
-            page_text = self.driver.page_source.lower()
-            
-            in_stock = False
-            quantity = 0
-            status_text = ""
+            stock = parse_stock_text(self.snapshot.html_lower,
+                                     self.region.in_stock_phrases, self.region.out_of_stock_phrases)
             
-            if "0 in stock" in page_text or "0 - in stock" in page_text:
-                in_stock = False
-                quantity = 0
-                status_text = "Out of Stock (0)"
-                logger.info("📉 OUT OF STOCK (0 units)")
-                
-            elif "out of stock" in page_text or "not available" in page_text:
-                in_stock = False
-                status_text = "Out of Stock"
-                logger.info("📉 OUT OF STOCK")
-                
-            elif "in stock" in page_text:
-                match = re.search(r'(\d+(?:,\d+)*)\s*(?:-\s*)?(?:in stock|available)', page_text, re.IGNORECASE)
-                if match:
-                    quantity = int(match.group(1).replace(',', ''))
-                    
-                    if quantity == 0:
-                        in_stock = False
-                        status_text = "Out of Stock (0)"
-                        logger.info("📉 OUT OF STOCK (0 units found)")
-                    else:
-                        in_stock = True
-                        status_text = f"{quantity} In Stock"
-                        logger.info(f"✅ IN STOCK: {status_text}")
-                else:
-                    in_stock = False
-                    status_text = "Out of Stock"
-                    logger.info("📉 OUT OF STOCK (no quantity)")
+            if stock['in_stock']:
+                logger.info(f"✅ IN STOCK: {stock['status_text']}")
+            else:
+                logger.info(f"📉 OUT OF STOCK: {stock['status_text'] or 'no quantity'}")
             
-            return {
-                'in_stock': in_stock,
-                'quantity': quantity,
-                'status_text': status_text
-            }
+            return stock
             
         except Exception as e:
             logger.error(f"❌ Stock check error: {str(e)}")
@@ -329,7 +479,6 @@ class DigikeyLeadTimeScraper:
             logger.info("🔎 Looking for Lead Time button...")
             
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-            time.sleep(0.5)  # ✅ OPTIMIZED: Reduced from 1-2s
             
             selectors = [
                 "//*[contains(text(), 'Check Lead Time')]",
@@ -339,43 +488,32 @@ class DigikeyLeadTimeScraper:
                 "//a[contains(@class, 'lead-time')]"
             ]
             
-            button = None
-            for selector in selectors:
-                try:
-                    button = self.wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                    logger.info(f"✅ Found button")
-                    break
-                except TimeoutException:
-                    continue
+            button = self.find_first("click_lead_time", selectors, timeout=self.timeout, clickable=True)
             
             if button is None:
                 logger.warning("⚠️ Button not found, scrolling more...")
                 for i in range(5):
                     self.driver.execute_script("window.scrollBy(0, 300);")
-                    time.sleep(0.3)  # ✅ OPTIMIZED: Reduced from 0.5-1s
+                    self.waiter.dom_quiet("click_lead_time.scroll", quiet_ms=150, timeout=1, replaces=0.3)
                 
-                for selector in selectors:
-                    try:
-                        button = self.driver.find_element(By.XPATH, selector)
-                        break
-                    except NoSuchElementException:
-                        continue
+                button = self.find_first("click_lead_time", selectors, timeout=0.5)
                 
                 if button is None:
                     logger.warning("⚠️ Button still not found")
                     return False
             
             self.scroll_to(button)
-            time.sleep(0.3)  # ✅ OPTIMIZED: Reduced from 1-2s
             
             try:
                 button.click()
             except:
                 self.driver.execute_script("arguments[0].click();", button)
+            self.invalidate_snapshot()
             
             logger.info("✅ Clicked Lead Time button")
             
-            time.sleep(1.5)  # ✅ OPTIMIZED: Reduced from 3-5s
+            self.waiter.element("click_lead_time.modal", (By.XPATH, "//*[@role='dialog']"),
+                                replaces=1.8, required=False)
             return True
     
         except Exception as e:
@@ -388,26 +526,16 @@ class DigikeyLeadTimeScraper:
             logger.info(f"📝 Entering: {quantity:,}")
             
             logger.info("⏳ Waiting for modal to appear...")
-            time.sleep(1)  # ✅ OPTIMIZED: Reduced from 7-10s to 1s
             
+            # Scoped to the modal - the page has its own quantity box further up
             selectors = [
-                '//input[@data-testid="lt-input-qty"]',
-                '//input[@inputmode="numeric"]',
-                '//input[@id="quantity-input"]',
-                '//input[contains(@class, "MuiInputBase-input")]',
+                '//*[@role="dialog"]//input[@data-testid="lt-input-qty"]',
+                '//*[@role="dialog"]//input[@inputmode="numeric"]',
+                '//*[@role="dialog"]//input[@id="quantity-input"]',
+                '//*[@role="dialog"]//input[contains(@class, "MuiInputBase-input")]',
             ]
             
-            input_field = None
-            for selector in selectors:
-                try:
-                    input_field = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    logger.info(f"✅ Found input with: {selector}")
-                    break
-                except TimeoutException:
-                    logger.debug(f"Selector failed: {selector}")
-                    continue
+            input_field = self.find_first("enter_quantity", selectors, timeout=10)
             
             if input_field is None:
                 logger.error("❌ Could not find input field")
@@ -419,6 +547,13 @@ class DigikeyLeadTimeScraper:
             except:
                 logger.warning("⚠️ Input may not be visible")
             
+            qty_str = str(quantity)
+            
+            if self.bulk_input:
+                if self.inject_quantity(input_field, qty_str):
+                    return True
+                logger.warning("⚠️ Value injection didn't stick, falling back to typing")
+            
             current = input_field.get_attribute('value')
             logger.info(f"Current value before input: '{current}'")
             
@@ -426,44 +561,40 @@ class DigikeyLeadTimeScraper:
             
             try:
                 input_field.click()
-                time.sleep(0.3)  # ✅ OPTIMIZED: Reduced from 0.5-1s
                 
                 input_field.send_keys(Keys.CONTROL + 'a')
-                time.sleep(0.1)  # ✅ OPTIMIZED: Reduced from 0.2-0.3s
                 input_field.send_keys(Keys.BACKSPACE)
-                time.sleep(0.3)  # ✅ OPTIMIZED: Reduced from 0.5-1s
+                self.waiter.until("enter_quantity.cleared",
+                                  lambda d: not input_field.get_attribute('value'),
+                                  timeout=2, replaces=1.7, required=False)
                 
                 logger.info("✅ Cleared field")
                 
-                qty_str = str(quantity)
                 logger.info(f"Typing: {qty_str}")
                 
-                for i, char in enumerate(qty_str):
+                for char in qty_str:
                     input_field.send_keys(char)
-                    time.sleep(0.06)  # ✅ OPTIMIZED: Reduced from 0.08
-                    if (i + 1) % 3 == 0:
-                        logger.info(f"Typed {i+1}/{len(qty_str)} characters...")
                 
                 logger.info(f"✅ Finished typing all {len(qty_str)} characters")
                 
-                time.sleep(0.5)  # ✅ OPTIMIZED: Reduced from 1-2s
+                self.waiter.until("enter_quantity.typed",
+                                  lambda d: quantity_matches(input_field.get_attribute('value'), qty_str),
+                                  timeout=2, replaces=0.06 * len(qty_str) + 0.5, required=False)
                 
                 input_field.send_keys(Keys.TAB)
+                self.invalidate_snapshot()
                 logger.info("✅ Pressed TAB to validate")
                 
-                time.sleep(0.5)  # ✅ OPTIMIZED: Reduced from 1-2s
+                self.waiter.dom_quiet("enter_quantity.validated", timeout=2, replaces=0.5)
                 
                 final_value = input_field.get_attribute('value')
                 logger.info(f"Final value in field: '{final_value}'")
                 
-                final_clean = final_value.replace(',', '').replace(' ', '')
-                expected = str(quantity)
-                
-                if final_clean == expected or expected in final_clean:
+                if quantity_matches(final_value, qty_str):
                     logger.info(f"✅ Successfully entered: {final_value}")
                     return True
                 else:
-                    logger.error(f"❌ Value mismatch. Expected: {expected}, Got: {final_clean}")
+                    logger.error(f"❌ Value mismatch. Expected: {qty_str}, Got: {final_value}")
                     
                     try:
                         screenshot_path = f"/tmp/qty_mismatch_{int(time.time())}.png"
@@ -492,43 +623,50 @@ class DigikeyLeadTimeScraper:
             logger.error(traceback.format_exc())
             return False
     
+    def inject_quantity(self, input_field, qty_str: str) -> bool:
+        """Set the quantity in one script call, verified with one value read (bulk_input)"""
+        try:
+            self.driver.execute_script(_SET_INPUT_VALUE_JS, input_field, qty_str)
+            self.invalidate_snapshot()
+            value = input_field.get_attribute('value')
+            if quantity_matches(value, qty_str):
+                logger.info(f"✅ Set quantity in one call: {value}")
+                return True
+            logger.debug(f"Injected value not kept: '{value}'")
+            return False
+        except Exception as e:
+            logger.debug(f"Value injection failed: {str(e)}")
+            return False
+    
     def click_update_button(self) -> bool:
         """Click Update button in lead time modal"""
         try:
             logger.info("🔘 Looking for Update button...")
             
             update_selectors = [
-                "//button[contains(text(), 'Update')]",
-                "//button[text()='Update']",
-                "//button[@type='button' and contains(., 'Update')]",
+                "//*[@role='dialog']//button[contains(text(), 'Update')]",
+                "//*[@role='dialog']//button[text()='Update']",
+                "//*[@role='dialog']//button[@type='button' and contains(., 'Update')]",
             ]
             
-            button = None
-            for selector in update_selectors:
-                try:
-                    button = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    logger.info("✅ Found Update button")
-                    break
-                except TimeoutException:
-                    continue
+            button = self.find_first("click_update_button", update_selectors, timeout=5, clickable=True)
             
             if button is None:
                 logger.warning("⚠️ Update button not found")
                 return False
             
             self.scroll_to(button)
-            time.sleep(0.3)  # ✅ OPTIMIZED: Reduced from 0.5-1s
+            self.waiter.arm()
             
             try:
                 button.click()
             except:
                 self.driver.execute_script("arguments[0].click();", button)
+            self.invalidate_snapshot()
             
             logger.info("✅ Clicked Update button")
             
-            time.sleep(2)  # ✅ OPTIMIZED: Reduced from 5-8s
+            self.waiter.network_idle("click_update_button.response", replaces=2.3)
             
             return True
             
@@ -547,52 +685,23 @@ class DigikeyLeadTimeScraper:
                 logger.warning("⚠️ No tables found")
                 return []
             
-            time.sleep(1)  # ✅ OPTIMIZED: Reduced from 2-3s
+            self.waiter.dom_quiet("extract_table.settled", timeout=3, replaces=1.0)
             
+            # Parse just the lead-time modal; the whole page only if the modal has no data
             lead_time_data = []
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            tables = soup.find_all('table')
-            
-            logger.info(f"Found {len(tables)} tables")
-            
-            for table_idx, table in enumerate(tables):
-                try:
-                    rows = table.find_all('tr')
-                    
-                    if len(rows) < 2:
-                        continue
-                    
-                    logger.info(f"Processing table {table_idx} with {len(rows)} rows")
-                    
-                    for row_idx, row in enumerate(rows[1:]):
-                        cells = row.find_all(['td', 'th'])
-                        
-                        if len(cells) >= 2:
-                            try:
-                                qty_text = cells[0].get_text().strip()
-                                qty = int(re.sub(r'[^\d]', '', qty_text))
-                                
-                                date_text = cells[1].get_text().strip()
-                                ship_date = self.parse_date(date_text)
-                                
-                                if qty > 0 and ship_date:
-                                    lead_time_data.append({
-                                        'qty': qty,
-                                        'ship_date': ship_date,
-                                        'raw_text': f"QTY: {qty}, Date: {date_text}"
-                                    })
-                                    logger.info(f"✅ Found: {qty:,} on {ship_date}")
-                                    
-                            except (ValueError, IndexError, AttributeError) as e:
-                                logger.debug(f"Row parse error: {str(e)}")
-                                continue
-                    
+            for selector in self.MODAL_SELECTORS:
+                modal_html = self.snapshot.fragment(selector)
+                if modal_html and '<table' in modal_html.lower():
+                    lead_time_data = extract_lead_times(modal_html, self.table_backend, self.date_parser)
                     if lead_time_data:
                         break
-                        
-                except Exception as e:
-                    logger.debug(f"Table error: {str(e)}")
-                    continue
+            
+            if not lead_time_data:
+                logger.info("Modal table not found, parsing full page")
+                lead_time_data = extract_lead_times(self.snapshot.html, self.table_backend, self.date_parser)
+            
+            for entry in lead_time_data:
+                logger.info(f"✅ Found: {entry['qty']:,} on {entry['ship_date']}")
             
             if not lead_time_data:
                 logger.warning("⚠️ No data extracted")
@@ -605,34 +714,58 @@ class DigikeyLeadTimeScraper:
             logger.error(f"❌ Extraction error: {str(e)}")
             return []
     
+    def index_key(self, part_number: str) -> str:
+        """Detail URLs differ per site - non-default regions get their own keys"""
+        if self.region.code == DEFAULT_REGION:
+            return part_number
+        return f"{self.region.code}:{part_number}"
+    
     def parse_date(self, date_str: str) -> Optional[str]:
-        """Parse date"""
-        if not date_str:
-            return None
+        """Parse date with the region's formats"""
+        return self.date_parser.parse(date_str)
+    
+    def scrape_part(self, part_number: str, max_age: Optional[float] = None) -> Dict[str, any]:
+        """Main scraping workflow (max_age in seconds caps cached result age, 0 forces a refresh)"""
+        if self.cache:
+            cached = self.cache.get(part_number, max_age=max_age)
+            if cached:
+                return cached
         
-        date_str = date_str.strip()
+        if self.driver is not None:
+            reason = self.health.recycle_reason(getattr(self.driver, 'browser_pid', None))
+            if reason:
+                self.restart_driver(reason)
         
-        formats = [
-            "%d.%m.%Y",
-            "%m/%d/%Y",
-            "%d/%m/%Y",
-            "%Y-%m-%d",
-            "%d-%m-%Y",
-            "%B %d, %Y",
-            "%d %B %Y",
-        ]
+        result = self.metrics.track("scrape_part", self._scrape_part, part_number, max_age,
+                                    ok=lambda r: r['success'])
         
-        for fmt in formats:
-            try:
-                parsed = datetime.strptime(date_str, fmt)
-                return parsed.strftime("%d.%m.%Y")
-            except ValueError:
-                continue
+        if not result['success'] and self.driver is not None and not self.driver_alive():
+            # Chrome crashed or hung mid-part - start a fresh one and re-run this part
+            self.restart_driver("driver not responding")
+            result = self.metrics.track("scrape_part", self._scrape_part, part_number, max_age,
+                                        ok=lambda r: r['success'])
         
-        return None
+        if self.driver is not None:
+            self.health.record_part(result['success'])
+        
+        if self.resource_blocker and self.perf_log:
+            self.perf_log.poll()
+            self.resource_blocker.page_report(part_number)
+        
+        lead_times_reused = result.pop('lead_times_reused', False)
+        fingerprint = result.pop('lead_time_fingerprint', None)
+        
+        if self.cache:
+            self.cache.put(result)
+        
+        if self.delta:
+            result['changes'] = self.delta.update(result, lead_times_reused, key=self.index_key(part_number),
+                                                  fingerprint=fingerprint)
+        
+        return result
     
-    def scrape_part(self, part_number: str) -> Dict[str, any]:
-        """Main scraping workflow"""
+    def _scrape_part(self, part_number: str, max_age: Optional[float] = None) -> Dict[str, any]:
+        """Uncached scraping workflow (max_age also caps reused lead times, see DeltaTracker)"""
         result = {
             'part_number': part_number,
             'success': False,
@@ -644,15 +777,43 @@ class DigikeyLeadTimeScraper:
         }
         
         try:
-            if not self.search_part(part_number):
-                result['error'] = "Part not found"
-                return result
-            
-            if not self.navigate_to_product(part_number):
-                result['error'] = "Navigation failed"
-                return result
+            if self.http_fetcher:
+                stock = self.metrics.track("http_fetch_stock", self.http_fetcher.fetch_stock, part_number,
+                                           ok=lambda r: r is not None)
+                if stock and self.url_index:
+                    self.url_index.put(self.index_key(part_number), stock['detail_url'])
+                if stock and stock['in_stock']:
+                    result['in_stock'] = True
+                    result['current_quantity'] = stock['quantity']
+                    result['success'] = True
+                    logger.info(f"⚡ {part_number}: In stock (HTTP)")
+                    return result
+            
+            if self.driver is None:
+                self.metrics.track("setup_driver", self.setup_driver, ok=lambda r: True)
+            
+            self.invalidate_snapshot()
+            
+            if self.perf_log:
+                self.perf_log.poll()  # drop events from the previous part
+            
+            known_url = self.url_index.get(self.index_key(part_number)) if self.url_index else None
+            
+            if not (known_url and self.metrics.track("open_detail_page", self.open_detail_page,
+                                                     part_number, known_url)):
+                if not self.metrics.track("search_part", self.search_part, part_number):
+                    result['error'] = "Part not found"
+                    return result
+                
+                if not self.metrics.track("navigate_to_product", self.navigate_to_product, part_number):
+                    result['error'] = "Navigation failed"
+                    return result
+                
+                if self.url_index:
+                    self.url_index.put(self.index_key(part_number), self.snapshot.url)
             
-            stock = self.check_stock()
+            stock = self.metrics.track("check_stock", self.check_stock,
+                                       ok=lambda r: r['status_text'] != 'Unknown')
             result['in_stock'] = stock['in_stock']
             result['current_quantity'] = stock['quantity']
             
@@ -661,19 +822,49 @@ class DigikeyLeadTimeScraper:
                 logger.info(f"✅ {part_number}: In stock")
                 return result
             
-            if not self.click_lead_time():
+            if self.delta:
+                # Stored with the result, however its lead times are obtained
+                result['lead_time_fingerprint'] = lead_time_fingerprint(self.snapshot.html_lower)
+            
+            if self.leadtime_api and self.leadtime_api.ready:
+                product_id = product_id_from_url(self.snapshot.url)
+                lead_times = None
+                if product_id:
+                    lead_times = self.metrics.track("leadtime_api", self.leadtime_api.fetch,
+                                                    product_id, self.LEAD_TIME_QTY)
+                if lead_times:
+                    result['lead_times'] = lead_times
+                    result['success'] = True
+                    logger.info(f"✅ Successfully scraped {part_number} (API)")
+                    return result
+            
+            if self.delta:
+                lead_times = self.delta.reusable_lead_times(self.index_key(part_number),
+                                                            result['lead_time_fingerprint'], max_age=max_age)
+                if lead_times:
+                    result['lead_times'] = lead_times
+                    result['success'] = True
+                    result['lead_times_reused'] = True
+                    logger.info(f"♻️ {part_number}: Lead-time info unchanged, reusing {len(lead_times)} lead times")
+                    return result
+            
+            if not self.metrics.track("click_lead_time", self.click_lead_time):
                 result['error'] = "Could not click lead time"
                 return result
             
-            if not self.enter_quantity():
+            if not self.metrics.track("enter_quantity", self.enter_quantity, self.LEAD_TIME_QTY):
                 result['error'] = "Could not enter quantity"
                 return result
             
-            if not self.click_update_button():
+            if not self.metrics.track("click_update_button", self.click_update_button):
                 result['error'] = "Could not click Update button"
                 return result
             
-            lead_times = self.extract_table()
+            if self.leadtime_api and not self.leadtime_api.ready:
+                self.leadtime_api.capture(self.perf_log.poll(), self.driver.current_url,
+                                          self.LEAD_TIME_QTY, self.driver.get_cookies())
+            
+            lead_times = self.metrics.track("extract_table", self.extract_table)
             result['lead_times'] = lead_times
             result['success'] = True if lead_times else False
             
@@ -689,16 +880,54 @@ class DigikeyLeadTimeScraper:
             result['error'] = str(e)
             return result
     
-    def close(self):
-        """Close driver"""
+    @property
+    def starts_lazily(self) -> bool:
+        """Chrome is only started for parts the HTTP fast path or cache can't answer"""
+        return self.http_fetcher is not None or self.cache is not None
+    
+    def driver_alive(self) -> bool:
+        """Cheap round-trip to check the browser still answers"""
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+    
+    def quit_driver(self):
+        """Quit Chrome only; the next scrape_part() starts a new one"""
         if self.driver:
+            if self.cookie_jar:
+                save_cookie_jar(self.driver, self.cookie_jar)
             try:
                 self.driver.quit()
                 logger.info("✅ Driver closed")
             except:
                 pass
+        self.driver = None
+        self.wait = None
+        self.waiter = None
+        self.perf_log = None
+        self.invalidate_snapshot()
+    
+    def restart_driver(self, reason: str):
+        """Recycle Chrome (it is started again lazily by the next part)"""
+        self.health.restarts += 1
+        logger.warning(f"♻️ Recycling driver: {reason} (restart #{self.health.restarts})")
+        self.quit_driver()
+        self.cookies_accepted = False
+        self.health.reset()
+    
+    def close(self):
+        """Close driver; a closed scraper never starts Chrome again"""
+        self.closed = True
+        if self.http_fetcher:
+            self.http_fetcher.close()
+        if self.leadtime_api:
+            self.leadtime_api.close()
+        self.quit_driver()
     
-    def print_results(self, result: Dict[str, any]):
+    @staticmethod
+    def print_results(result: Dict[str, any]):
         """Print results"""
         print("\n" + "="*70)
         print(f"PART NUMBER: {result['part_number']}")
@@ -723,8 +952,37 @@ class DigikeyLeadTimeScraper:
 
 
 
-def main():
-    """Main execution with summary - OPTIMIZED"""
+def main(workers: int = 1, headless: bool = False, http_fast_path: bool = False,
+         cache_path: Optional[str] = None, url_index_path: Optional[str] = None,
+         profile_root: Optional[str] = None, block_resources: bool = False,
+         input_path: Optional[str] = None, journal_path: Optional[str] = None,
+         retry_failed: bool = False, output_paths: Optional[List[str]] = None,
+         metrics_port: Optional[int] = None, regions: Optional[List[str]] = None,
+         selectors_path: Optional[str] = None, delta_path: Optional[str] = None,
+         events_path: Optional[str] = None, leadtime_api_path: Optional[str] = None):
+    """Main execution with summary - OPTIMIZED
+
+    workers > 1 runs the parts on a ScraperPool, one Chrome per worker.
+    http_fast_path starts Chrome lazily, only for parts HTTP can't answer.
+    cache_path enables the on-disk result cache shared by all workers.
+    url_index_path enables the detail-URL index so known parts skip search.
+    profile_root keeps a warm Chrome profile + cookie jar per worker.
+    block_resources drops images, fonts, media and trackers in Chrome.
+    input_path reads part numbers from a CSV/BOM file instead of test_parts.
+    journal_path appends each result to a JSONL journal and skips parts
+    already journaled, so an interrupted run resumes where it stopped.
+    output_paths streams results to .jsonl/.csv/.parquet files as they finish;
+    CSV/JSONL append across resumed runs, Parquet starts a new part file.
+    metrics_port serves per-stage Prometheus metrics on 127.0.0.1:<port>/metrics.
+    regions (e.g. ["de", "us"]) checks every part on those Digi-Key sites in
+    parallel, one Chrome per region per worker, and merges the results.
+    selectors_path keeps the learned selector ordering across runs.
+    delta_path enables incremental refresh against the last run's results:
+    parts whose lead-time info is unchanged reuse stored rows, output_paths only receive parts
+    that changed, and change events are appended to events_path (JSONL).
+    leadtime_api_path replays the lead-time XHR instead of driving the modal;
+    the request is loaded from that file, or captured once and saved there.
+    """
     
     test_parts = [
         "AD5412AREZ",
@@ -732,29 +990,129 @@ def main():
         "CLA4603-085LF"
     ]
     
+    # Unknown codes fail here, before anything is opened; "DE" and "de" are one site
+    if regions:
+        regions = list(dict.fromkeys(get_region(code).code for code in regions))
+    
+    if input_path:
+        test_parts = list(read_parts(input_path))
+    
+    journal = Journal(journal_path, retry_failed=retry_failed) if journal_path else None
+    if journal:
+        total = len(test_parts)
+        test_parts = list(journal.pending(test_parts))
+        logger.info(f"📒 Resuming: {total - len(test_parts)} of {total} parts already done")
+    
+    # Same MPN in another case/spacing/packaging suffix is scraped once
+    groups = group_parts(test_parts)
+    
+    sinks = [open_sink(path) for path in output_paths or []]
+    
+    delta = DeltaTracker(delta_path) if delta_path else None
+    events_sink = JsonlSink(events_path) if events_path else None
+    change_count = 0
+    
+    def record(result: Dict[str, any]):
+        nonlocal change_count
+        if journal:
+            journal.append(result)
+        changes = result.get('changes') or []
+        change_count += len(changes)
+        if events_sink:
+            for event in changes:
+                events_sink.write(event)
+        if delta and not changes and result['success']:
+            return  # incremental mode: unchanged parts produce no output rows
+        for sink in sinks:
+            sink.write(result)
+    
+    def record_all(requested: List[str], result: Dict[str, any]):
+        """One record per input spelling of a deduplicated part"""
+        for part_number in requested:
+            record(result_for(result, part_number))
+    
     print("\n" + "="*70)
     print("🚀 Digikey Lead Time Scraper - OPTIMIZED ⚡")
     print("="*70)
     start_time = time.time()
     print(f"📅 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"📦 Processing {len(test_parts)} parts")
+    print(f"📦 Processing {len(test_parts)} parts ({len(groups)} unique)")
+    print(f"🧵 Workers: {workers}")
+    if regions:
+        print(f"🌍 Regions: {', '.join(regions)}")
     print("="*70 + "\n")
     
     scraper = None
-    results = []
+    results = ResultStore()  # compact columns; yields result dicts on iteration
+    wait_stats = StepStats()
+    metrics = StageMetrics()
+    rate_limiter = AdaptiveRateLimiter()
+    metrics_server = start_metrics_server(metrics, metrics_port) if metrics_port else None
+    cache = ResultCache(cache_path) if cache_path else None
+    url_index = DetailUrlIndex(url_index_path) if url_index_path else None
+    selectors = SelectorRegistry(selectors_path)
+    
+    # Each site gets its own pacing, shared by all workers
+    region_limiters = {code: AdaptiveRateLimiter() for code in regions or []}
+    
+    def make_region_scraper(worker_id: int, region: Optional[Region] = None) -> DigikeyLeadTimeScraper:
+        root = os.path.join(profile_root, region.code) if profile_root and region else profile_root
+        profile_dir = worker_profile_dir(root, worker_id)
+        template_path = leadtime_api_path
+        if leadtime_api_path and region:
+            # The endpoint lives on each site's own host
+            base, ext = os.path.splitext(leadtime_api_path)
+            template_path = f"{base}.{region.code}{ext}"
+        return DigikeyLeadTimeScraper(
+            headless=headless,
+            wait_stats=wait_stats,
+            metrics=metrics,
+            rate_limiter=region_limiters[region.code] if region else rate_limiter,
+            http_fast_path=http_fast_path,
+            leadtime_api=LeadTimeApiClient(template_path=template_path) if template_path else None,
+            cache=None if region else cache,
+            url_index=url_index,
+            profile_dir=profile_dir,
+            cookie_jar=os.path.join(profile_dir, "cookies.json") if profile_dir else None,
+            resource_blocker=ResourceBlocker() if block_resources else None,
+            region=region,
+            selectors=selectors,
+            delta=delta
+        )
+    
+    def make_scraper(worker_id: int):
+        if regions:
+            return MultiRegionScraper(lambda region: make_region_scraper(worker_id, region),
+                                      regions=regions, cache=cache)
+        return make_region_scraper(worker_id)
     
     try:
-        scraper = DigikeyLeadTimeScraper(headless=False)
-        scraper.setup_driver()  # ✅ SETUP ONCE
-        
-        for idx, part_number in enumerate(test_parts):
-            result = scraper.scrape_part(part_number)
-            results.append(result)
-            scraper.print_results(result)
-            
-            if idx < len(test_parts) - 1:
-                logger.info("⏳ Waiting...")
-                time.sleep(0.5)  # ✅ OPTIMIZED: Reduced from 1s
+        if workers > 1:
+            with ScraperPool(make_scraper, workers=workers) as pool:
+                futures = {pool.submit(requested[0]): requested for requested in groups.values()}
+                # Handle parts as they finish and drop each future, so finished
+                # results only live on in the compact ResultStore
+                for future in as_completed(futures):
+                    requested = futures.pop(future)
+                    if future.cancelled():
+                        continue
+                    result = future.result()
+                    record_all(requested, result)
+                    for part_number in requested:
+                        results.append(result_for(result, part_number))
+                    DigikeyLeadTimeScraper.print_results(result)
+        else:
+            scraper = make_scraper(0)
+            if not scraper.starts_lazily:
+                metrics.track("setup_driver", scraper.setup_driver, ok=lambda r: True)  # ✅ SETUP ONCE
+            
+            # No fixed gap between parts - the shared rate limiter paces page loads
+            for requested in groups.values():
+                result = scraper.scrape_part(requested[0])
+                record_all(requested, result)
+                for part_number in requested:
+                    results.append(result_for(result, part_number))
+                DigikeyLeadTimeScraper.print_results(result)
     except KeyboardInterrupt:
         logger.warning("⚠️ Interrupted")
     except Exception as e:
@@ -762,10 +1120,29 @@ def main():
     finally:
         if scraper:
             scraper.close()
+        if cache:
+            cache.close()
+        if url_index:
+            url_index.close()
+        if journal:
+            journal.close()
+        selectors.save()
+        if delta:
+            delta.close()
+        for sink in sinks:
+            sink.close()
+        if events_sink:
+            events_sink.close()
+        if metrics_server:
+            metrics_server.shutdown()
+    
+    wait_stats.log_summary()
+    metrics.log_summary()
+    selectors.log_summary()
     
     # ✅ SUMMARY TABLE
     elapsed = time.time() - start_time
-    successful = sum(1 for r in results if r['success'])
+    successful = results.successful()
     failed = len(results) - successful
     
     print("\n" + "="*70)
@@ -777,8 +1154,10 @@ def main():
         print(f"📈 Average per part: {elapsed/len(test_parts):.1f}s")
     print(f"✅ Successful: {successful}/{len(test_parts)}")
     print(f"❌ Failed: {failed}/{len(test_parts)}")
+    if delta:
+        print(f"🔔 Changes: {change_count}")
     if elapsed > 0:
-        print(f"🚀 Speed improvement: ~{253/elapsed:.1f}x faster!")
+        print(f"🚀 Throughput: {len(results) / elapsed * 60:.1f} parts/minute")
     print("="*70 + "\n")
     
     # ✅ RESULTS TABLE
@@ -815,5 +1194,31 @@ def main():
     print("\n" + "="*70 + "\n")
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Command-line options, one per main() keyword argument"""
+    parser = argparse.ArgumentParser(description="Digi-Key lead-time scraper")
+    parser.add_argument("input_path", nargs="?", help="CSV/BOM file with part numbers (default: built-in test parts)")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--http-fast-path", action="store_true")
+    parser.add_argument("--cache", dest="cache_path", help="result cache path (SQLite)")
+    parser.add_argument("--url-index", dest="url_index_path", help="detail-URL index path (SQLite)")
+    parser.add_argument("--profile-root", help="per-worker Chrome profiles + cookie jars")
+    parser.add_argument("--block-resources", action="store_true")
+    parser.add_argument("--journal", dest="journal_path", help="JSONL journal for resumable runs")
+    parser.add_argument("--retry-failed", action="store_true", help="re-run parts journaled as failed")
+    parser.add_argument("--output", dest="output_paths", action="append",
+                        help=".jsonl/.csv/.parquet output file (repeatable)")
+    parser.add_argument("--metrics-port", type=int)
+    parser.add_argument("--region", dest="regions", action="append", type=str.lower, choices=list(REGIONS),
+                        help="Digi-Key site code (repeatable)")
+    parser.add_argument("--selectors", dest="selectors_path", help="learned selector stats path (JSON)")
+    parser.add_argument("--delta", dest="delta_path", help="incremental refresh baseline (SQLite)")
+    parser.add_argument("--events", dest="events_path", help="change events output (JSONL)")
+    parser.add_argument("--leadtime-api", dest="leadtime_api_path", nargs="?", const="digikey_leadtime_api.json",
+                        help="replay the lead-time request; template file loaded or saved after capture")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(**vars(parse_args()))
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+Per-stage latency histograms and success/failure counters
+Optionally served in Prometheus text format on a local /metrics endpoint.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Tuple
+import bisect
+import logging
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Bucket upper bound containing the q-quantile"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        running = 0
+        for idx, count in enumerate(self.counts):
+            running += count
+            if running >= target:
+                return self.buckets[idx] if idx < len(self.buckets) else float('inf')
+        return float('inf')
+
+
+class StageMetrics:
+    """Thread-safe per-stage timings, shareable between scrapers"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, prefix: str = "digikey"):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, _Histogram] = {}
+        self._outcomes: Dict[Tuple[str, str], int] = {}
+
+    def observe(self, stage: str, seconds: float, ok: bool):
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = _Histogram(self.buckets)
+            histogram.observe(seconds)
+            key = (stage, "success" if ok else "failure")
+            self._outcomes[key] = self._outcomes.get(key, 0) + 1
+
+    def track(self, stage: str, fn: Callable, *args, ok: Callable[[any], bool] = bool, **kwargs):
+        """Call fn, time it under `stage`; ok(result) decides success, exceptions count as failure"""
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            self.observe(stage, time.perf_counter() - start, False)
+            raise
+        self.observe(stage, time.perf_counter() - start, ok(result))
+        return result
+
+    def summary(self) -> List[Dict[str, any]]:
+        with self._lock:
+            rows = []
+            for stage, histogram in self._histograms.items():
+                rows.append({
+                    'stage': stage,
+                    'count': histogram.count,
+                    'mean': histogram.sum / histogram.count if histogram.count else 0.0,
+                    'p50': histogram.quantile(0.5),
+                    'p95': histogram.quantile(0.95),
+                    'success': self._outcomes.get((stage, "success"), 0),
+                    'failure': self._outcomes.get((stage, "failure"), 0),
+                })
+            return rows
+
+    def log_summary(self):
+        rows = self.summary()
+        if not rows:
+            return
+        logger.info("📈 Stage timings (p50/p95 are bucket upper bounds)")
+        for row in rows:
+            logger.info(
+                f"  {row['stage']:<22} n={row['count']:<5} mean={row['mean']:.2f}s "
+                f"p50<={row['p50']}s p95<={row['p95']}s ok={row['success']} fail={row['failure']}"
+            )
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format"""
+        duration = f"{self.prefix}_stage_duration_seconds"
+        total = f"{self.prefix}_stage_total"
+        lines = [
+            f"# HELP {duration} Time spent in each scrape pipeline stage.",
+            f"# TYPE {duration} histogram",
+        ]
+        with self._lock:
+            for stage, histogram in sorted(self._histograms.items()):
+                running = 0
+                for bound, count in zip(self.buckets, histogram.counts):
+                    running += count
+                    lines.append(f'{duration}_bucket{{stage="{stage}",le="{bound}"}} {running}')
+                lines.append(f'{duration}_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{duration}_sum{{stage="{stage}"}} {histogram.sum}')
+                lines.append(f'{duration}_count{{stage="{stage}"}} {histogram.count}')
+
+            lines.append(f"# HELP {total} Stage runs by outcome.")
+            lines.append(f"# TYPE {total} counter")
+            for (stage, outcome), count in sorted(self._outcomes.items()):
+                lines.append(f'{total}{{stage="{stage}",outcome="{outcome}"}} {count}')
+
+        return "\n".join(lines) + "\n"
+
+
+def start_metrics_server(metrics: StageMetrics, port: int = 9108, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve GET /metrics from a daemon thread; call .shutdown() on the result to stop"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(f"metrics: {format % args}")
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info(f"📈 Metrics on http://{host}:{port}/metrics")
+    return server
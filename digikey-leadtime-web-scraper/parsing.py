@@ -0,0 +1,250 @@
+"""
+Page parsing helpers shared by the Selenium and HTTP scrape paths
+"""
+from datetime import date
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Tuple
+import hashlib
+import re
+
+
+IN_STOCK_PHRASES = ("in stock",)
+OUT_OF_STOCK_PHRASES = ("out of stock", "not available")
+
+
+@lru_cache(maxsize=32)
+def _stock_patterns(in_stock_phrases: Tuple[str, ...]) -> Tuple[Pattern, Pattern]:
+    phrases = "|".join(re.escape(phrase) for phrase in in_stock_phrases + ("available",))
+    quantity_re = re.compile(rf'(\d{{1,3}}(?:[,.]\d{{3}})+|\d+)\s*(?:-\s*)?(?:{phrases})', re.IGNORECASE)
+    # A bare "0", not the tail of "1,240 in stock"
+    zero_re = re.compile(rf'(?<![\d,.])0\s*(?:-\s*)?(?:{phrases.replace("|available", "")})')
+    return quantity_re, zero_re
+
+
+def quantity_matches(value: Optional[str], expected: str) -> bool:
+    """Whether an input's value shows the expected quantity, ignoring separators"""
+    return bool(value) and expected in re.sub(r'[,.\s]', '', value)
+
+
+CHALLENGE_MARKERS = (
+    "captcha",
+    "cf-chl",
+    "challenge-platform",
+    "access denied",
+    "_incapsula_",
+    "px-captcha",
+)
+
+
+def is_challenge_page(page_text: str) -> bool:
+    """Bot-challenge/block page? Only the head is checked - real pages embed e.g. recaptcha further down"""
+    head = page_text[:20000].lower()
+    return any(marker in head for marker in CHALLENGE_MARKERS)
+
+
+# Text near these on the detail page describes lead time and procurement
+LEAD_TIME_MARKERS = (
+    "lead time",
+    "ship date",
+    "backorder",
+    "back order",
+    "on order",
+    "lieferzeit",
+)
+
+_TAG_RE = re.compile(r'<[^>]*>?')
+
+
+def lead_time_fingerprint(page_text: str, markers: Tuple[str, ...] = LEAD_TIME_MARKERS,
+                          window: int = 300) -> Optional[str]:
+    """
+    Hash of the text that follows each lead-time/procurement marker in the
+    lowercased page HTML (tags dropped), None if the page has none. It changes
+    when the page's lead-time or procurement info does.
+    """
+    pattern = re.compile("|".join(re.escape(marker) for marker in markers))
+    snippets = []
+    for match in pattern.finditer(page_text):
+        text = _TAG_RE.sub(" ", page_text[match.start():match.start() + window])
+        snippets.append(" ".join(text.split()))
+    if not snippets:
+        return None
+    return hashlib.sha1("\n".join(snippets).encode("utf-8")).hexdigest()
+
+
+DATE_FORMATS = [
+    "%d.%m.%Y",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%Y-%m-%d",
+    "%d-%m-%Y",
+    "%B %d, %Y",
+    "%d %B %Y",
+]
+
+
+MONTH_NAMES = {
+    name: number
+    for number, names in enumerate([
+        ("january", "jan"), ("february", "feb"), ("march", "mar"), ("april", "apr"),
+        ("may",), ("june", "jun"), ("july", "jul"), ("august", "aug"),
+        ("september", "sep", "sept"), ("october", "oct"), ("november", "nov"), ("december", "dec"),
+    ], start=1)
+    for name in names
+}
+
+_DIRECTIVES = {
+    "%d": r"(?P<d>\d{1,2})",
+    "%m": r"(?P<m>\d{1,2})",
+    "%Y": r"(?P<Y>\d{4})",
+    "%B": r"(?P<B>[^\W\d_]+)\.?",
+    "%b": r"(?P<B>[^\W\d_]+)\.?",
+}
+
+
+def compile_date_format(fmt: str) -> Pattern:
+    """strptime-style format -> anchored regex with named d/m/Y/B groups"""
+    pattern = ""
+    i = 0
+    while i < len(fmt):
+        directive = fmt[i:i + 2]
+        if directive in _DIRECTIVES:
+            pattern += _DIRECTIVES[directive]
+            i += 2
+        elif fmt[i].isspace():
+            pattern += r"\s+"
+            i += 1
+        else:
+            pattern += re.escape(fmt[i])
+            i += 1
+    return re.compile(f"^{pattern}$", re.IGNORECASE)
+
+
+def _format_shape(fmt: str) -> str:
+    """Formats with the same shape can match the same string ("%d/%m/%Y" vs "%m/%d/%Y")"""
+    shape = re.sub(r"%[dm]", "N", fmt)
+    shape = re.sub(r"%[Bb]", "B", shape)
+    return re.sub(r"\s+", " ", shape)
+
+
+class DateParser:
+    """
+    Regex-based date parser: formats are compiled once, the format that
+    matched last is tried first (pages are consistent), and results are
+    cached per distinct string.
+    Ambiguous strings always resolve by format order, never by what was
+    parsed before, so one instance can be shared between threads.
+    """
+
+    def __init__(self, formats: List[str] = DATE_FORMATS,
+                 month_names: Optional[Dict[str, int]] = None,
+                 cache_size: int = 4096):
+        self.formats = list(formats)
+        self.month_names = dict(MONTH_NAMES, **(month_names or {}))
+        self._patterns = [compile_date_format(fmt) for fmt in self.formats]
+        shapes = [_format_shape(fmt) for fmt in self.formats]
+        # Earlier formats that may match the same strings - they win over a preferred later one
+        self._rivals = [[j for j in range(i) if shapes[j] == shapes[i]] for i in range(len(shapes))]
+        self._preferred = 0
+        self._cache_size = cache_size
+        self._cache: Dict[str, Optional[str]] = {}
+
+    def _try(self, index: int, date_str: str) -> Optional[str]:
+        match = self._patterns[index].match(date_str)
+        if not match:
+            return None
+        groups = match.groupdict()
+        if groups.get("B"):
+            month = self.month_names.get(groups["B"].lower())
+            if month is None:
+                return None
+        else:
+            month = int(groups["m"])
+        day, year = int(groups["d"]), int(groups["Y"])
+        try:
+            date(year, month, day)
+        except ValueError:
+            return None
+        return f"{day:02d}.{month:02d}.{year:04d}"
+
+    def parse(self, date_str: str) -> Optional[str]:
+        """Parse a lead-time date into "%d.%m.%Y", None if no format matches"""
+        if not date_str:
+            return None
+
+        date_str = date_str.strip()
+        try:
+            return self._cache[date_str]
+        except KeyError:
+            pass
+
+        preferred = self._preferred
+        parsed = self._try(preferred, date_str)
+        if parsed is not None:
+            for index in self._rivals[preferred]:
+                rival = self._try(index, date_str)
+                if rival is not None:
+                    parsed = rival
+                    break
+        else:
+            for index in range(len(self._patterns)):
+                if index == preferred:
+                    continue
+                parsed = self._try(index, date_str)
+                if parsed is not None:
+                    self._preferred = index
+                    break
+
+        if self._cache_size > 0:
+            if len(self._cache) >= self._cache_size:
+                self._cache.clear()
+            self._cache[date_str] = parsed
+        return parsed
+
+    @property
+    def preferred_format(self) -> str:
+        return self.formats[self._preferred]
+
+
+_default_date_parser = DateParser()
+
+
+def parse_date(date_str: str) -> Optional[str]:
+    """Parse a lead-time date into "%d.%m.%Y", None if no format matches"""
+    return _default_date_parser.parse(date_str)
+
+
+def parse_stock_text(page_text: str,
+                     in_stock_phrases: Tuple[str, ...] = IN_STOCK_PHRASES,
+                     out_of_stock_phrases: Tuple[str, ...] = OUT_OF_STOCK_PHRASES) -> Dict[str, any]:
+    """Parse stock status from lowercased page text/HTML (phrases are per site language)"""
+    quantity_re, zero_re = _stock_patterns(tuple(in_stock_phrases))
+    
+    in_stock = False
+    quantity = 0
+    status_text = ""
+    
+    if zero_re.search(page_text):
+        status_text = "Out of Stock (0)"
+        
+    elif any(phrase in page_text for phrase in out_of_stock_phrases):
+        status_text = "Out of Stock"
+        
+    elif any(phrase in page_text for phrase in in_stock_phrases):
+        match = quantity_re.search(page_text)
+        if match:
+            quantity = int(re.sub(r'[,.]', '', match.group(1)))
+            
+            if quantity == 0:
+                status_text = "Out of Stock (0)"
+            else:
+                in_stock = True
+                status_text = f"{quantity} In Stock"
+        else:
+            status_text = "Out of Stock"
+    
+    return {
+        'in_stock': in_stock,
+        'quantity': quantity,
+        'status_text': status_text
+    }
@@ -0,0 +1,288 @@
+"""
+Parallel worker pool for DigikeyLeadTimeScraper
+Each worker owns its own scraper + Chrome driver and pulls parts from a shared queue.
+"""
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+import logging
+import os
+import queue
+import threading
+import time
+
+from dedup import SingleFlight
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = max(1, min(os.cpu_count() or 1, 4))
+
+_STOP = object()
+
+
+def failed_result(part_number: str, error: str) -> Dict[str, any]:
+    """Result dict in the same shape as scrape_part() for parts that never ran"""
+    return {
+        'part_number': part_number,
+        'success': False,
+        'in_stock': False,
+        'current_quantity': 0,
+        'lead_times': [],
+        'error': error,
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+class ScraperPool:
+    """N scrapers, each with its own driver, fed from one shared queue"""
+
+    def __init__(self,
+                 scraper_factory: Callable[[int], any],
+                 workers: int = DEFAULT_WORKERS,
+                 max_restarts: int = 3,
+                 reset_restarts_after: int = 20,
+                 restart_delay: float = 2.0,
+                 queue_size: int = 0,
+                 coalesce: bool = True,
+                 warm: bool = False):
+        """
+        scraper_factory(worker_id) must return a new, not yet started scraper.
+        A worker restarts its scraper after a crash or a dead driver, at most
+        `max_restarts` times before retiring; the count is forgiven after
+        `reset_restarts_after` parts in a row without one. Ordinary failures
+        ("Part not found") are left to the scraper's DriverHealthMonitor.
+        coalesce makes submits of an equivalent part number (see dedup.py)
+        share the one queued or running scrape instead of scraping it again.
+        warm starts every worker's scraper (scraper.warm_up()) right away
+        instead of on its first part - for long-lived services. Otherwise
+        Chrome is started with the scraper unless it reports starts_lazily.
+        """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+
+        self.scraper_factory = scraper_factory
+        self.workers = workers
+        self.max_restarts = max_restarts
+        self.reset_restarts_after = reset_restarts_after
+        self.restart_delay = restart_delay
+        self.warm = warm
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._single_flight = SingleFlight() if coalesce else None
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._alive = 0
+        self._started = False
+        self._closed = False
+
+    def start(self):
+        """Start worker threads"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            self._alive = self.workers
+
+        for worker_id in range(self.workers):
+            thread = threading.Thread(
+                target=self._run_worker,
+                args=(worker_id,),
+                name=f"scraper-worker-{worker_id}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        logger.info(f"🧵 Started {self.workers} workers")
+
+    def submit(self, part_number: str, block: bool = True, timeout: Optional[float] = None) -> Future:
+        """Queue one part, returns a Future resolving to the scrape_part() dict"""
+        if self._closed:
+            raise RuntimeError("Pool is closed")
+        if not self._started:
+            self.start()
+
+        with self._lock:
+            no_workers = self._alive == 0
+        if no_workers:
+            future = Future()
+            future.set_result(failed_result(part_number, "No live workers"))
+            return future
+
+        if self._single_flight:
+            future, is_leader = self._single_flight.join(part_number)
+            if not is_leader:
+                return future
+        else:
+            future = Future()
+
+        try:
+            self._queue.put((part_number, future), block=block, timeout=timeout)
+        except queue.Full as e:
+            future.set_exception(e)  # releases followers that joined meanwhile
+            raise
+
+        # The last worker may have retired and drained the queue since the check above
+        with self._lock:
+            no_workers = self._alive == 0
+        if no_workers:
+            self._fail_queued()
+        return future
+
+    def map(self, parts: Iterable[str]) -> List[Dict[str, any]]:
+        """Scrape all parts and return results in input order"""
+        futures = [self.submit(part_number) for part_number in parts]
+        return [future.result() for future in futures]
+
+    def pending(self) -> int:
+        """Parts queued but not yet picked up by a worker"""
+        return self._queue.qsize()
+
+    def workers_alive(self) -> int:
+        with self._lock:
+            return self._alive
+
+    def close(self, wait: bool = True, cancel_pending: bool = False):
+        """Stop workers once the queue is drained and quit all drivers"""
+        if self._closed:
+            return
+        self._closed = True
+
+        if cancel_pending:
+            self._cancel_pending()
+
+        for _ in self._threads:
+            self._queue.put(_STOP)
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+        logger.info("✅ Pool closed")
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(cancel_pending=exc_type is not None)
+
+    def _cancel_pending(self):
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not _STOP:
+                item[1].cancel()
+
+    def _start_scraper(self, worker_id: int):
+        scraper = self.scraper_factory(worker_id)
+        try:
+            if self.warm:
+                scraper.warm_up()
+            elif not getattr(scraper, 'starts_lazily', False):
+                scraper.setup_driver()
+        except Exception:
+            self._stop_scraper(scraper)
+            raise
+        return scraper
+
+    def _stop_scraper(self, scraper):
+        if scraper is None:
+            return
+        try:
+            scraper.close()
+        except Exception as e:
+            logger.debug(f"Worker close error: {e}")
+
+    @staticmethod
+    def _driver_alive(scraper) -> bool:
+        """Scrapers without a driver_alive() check are assumed healthy"""
+        check = getattr(scraper, 'driver_alive', None)
+        if check is None or getattr(scraper, 'driver', None) is None:
+            return True
+        try:
+            return check()
+        except Exception:
+            return False
+
+    def _run_worker(self, worker_id: int):
+        scraper = None
+        restarts = 0
+        healthy_parts = 0
+
+        try:
+            if self.warm:
+                try:
+                    scraper = self._start_scraper(worker_id)
+                except Exception as e:
+                    logger.error(f"❌ Worker {worker_id} warm-up failed: {e}")
+                    scraper = None
+
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+
+                part_number, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                needs_restart = False
+                try:
+                    if scraper is None:
+                        scraper = self._start_scraper(worker_id)
+                    result = scraper.scrape_part(part_number)
+                except Exception as e:
+                    logger.error(f"❌ Worker {worker_id} crashed on {part_number}: {e}")
+                    result = failed_result(part_number, str(e))
+                    needs_restart = True
+
+                future.set_result(result)
+
+                if not needs_restart and not result['success'] and not self._driver_alive(scraper):
+                    logger.warning(f"⚠️ Worker {worker_id}: driver not responding")
+                    needs_restart = True
+
+                if not needs_restart:
+                    healthy_parts += 1
+                    if restarts and healthy_parts >= self.reset_restarts_after:
+                        logger.info(f"✅ Worker {worker_id} healthy again, restart count reset")
+                        restarts = 0
+                    continue
+
+                healthy_parts = 0
+                if restarts >= self.max_restarts:
+                    logger.error(f"❌ Worker {worker_id} retired after {restarts} restarts")
+                    break
+                restarts += 1
+                logger.info(f"🔄 Restarting worker {worker_id} ({restarts}/{self.max_restarts})")
+                self._stop_scraper(scraper)
+                scraper = None
+                time.sleep(self.restart_delay)
+        finally:
+            self._stop_scraper(scraper)
+            self._retire_worker(worker_id)
+
+    def _retire_worker(self, worker_id: int):
+        with self._lock:
+            self._alive -= 1
+            last = self._alive == 0
+
+        if last:
+            self._fail_queued()
+
+    def _fail_queued(self):
+        """Nobody is left to pick up queued parts - fail them instead of hanging callers"""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                continue
+            part_number, future = item
+            if future.set_running_or_notify_cancel():
+                future.set_result(failed_result(part_number, "No live workers"))
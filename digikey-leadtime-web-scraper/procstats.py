@@ -0,0 +1,69 @@
+"""
+Process-tree memory sampling (Linux /proc, no extra dependencies)
+"""
+from typing import Dict, List
+import os
+import threading
+
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _children_map() -> Dict[int, List[int]]:
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # comm may contain spaces/parens - ppid is the 2nd field after the last ')'
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def process_tree_rss(pid: int) -> int:
+    """Resident bytes of pid and all its descendants, 0 if /proc is unavailable"""
+    if not os.path.isdir("/proc"):
+        return 0
+
+    children = _children_map()
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f"/proc/{current}/statm") as f:
+                total += int(f.read().split()[1]) * _PAGE_SIZE
+        except (OSError, ValueError, IndexError):
+            pass
+        stack.extend(children.get(current, []))
+    return total
+
+
+class PeakRssSampler:
+    """Background thread tracking the peak process_tree_rss(pid)"""
+
+    def __init__(self, pid: int = None, interval: float = 0.5):
+        self.pid = pid or os.getpid()
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, process_tree_rss(self.pid))
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, process_tree_rss(self.pid))
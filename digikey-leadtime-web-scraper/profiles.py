@@ -0,0 +1,63 @@
+"""
+Warm-start browser profiles: persistent user-data-dir and saved cookie jar
+They keep consent state and the HTTP cache across runs; one of each per worker.
+"""
+from typing import Optional
+import json
+import logging
+import os
+
+
+logger = logging.getLogger(__name__)
+
+# OneTrust writes this once the banner has been accepted or dismissed
+CONSENT_COOKIES = ("OptanonAlertBoxClosed",)
+
+
+def worker_profile_dir(root: Optional[str], worker_id: int) -> Optional[str]:
+    """Separate Chrome profile per worker - Chrome locks a profile to one process"""
+    if not root:
+        return None
+    path = os.path.join(root, f"worker-{worker_id}")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def load_cookie_jar(driver, path: str) -> int:
+    """Restore cookies through CDP (no navigation needed), returns count loaded"""
+    if not os.path.exists(path):
+        return 0
+    try:
+        with open(path, encoding='utf-8') as f:
+            cookies = json.load(f)
+        driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+        logger.info(f"🍪 Loaded {len(cookies)} cookies from {path}")
+        return len(cookies)
+    except Exception as e:
+        logger.warning(f"⚠️ Cookie jar load failed: {e}")
+        return 0
+
+
+def save_cookie_jar(driver, path: str) -> int:
+    """Write all browser cookies to path, returns count saved"""
+    try:
+        cookies = driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cookies, f)
+        os.replace(tmp_path, path)
+        logger.info(f"🍪 Saved {len(cookies)} cookies to {path}")
+        return len(cookies)
+    except Exception as e:
+        logger.warning(f"⚠️ Cookie jar save failed: {e}")
+        return 0
+
+
+def has_consent_cookie(driver) -> bool:
+    """True when the cookie banner was already accepted in this profile/jar"""
+    try:
+        cookies = driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+    except Exception as e:
+        logger.debug(f"Cookie lookup failed: {e}")
+        return False
+    return any(cookie.get('name') in CONSENT_COOKIES for cookie in cookies)
@@ -0,0 +1,95 @@
+"""
+Adaptive rate limiter shared across workers
+Token bucket whose rate grows additively while Digi-Key answers normally and
+is cut multiplicatively, with exponential backoff, on timeouts, 403/429 and
+challenge pages.
+"""
+from typing import Dict
+import logging
+import random
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveRateLimiter:
+    """Thread-safe AIMD token bucket - pass one instance to every scraper"""
+
+    def __init__(self,
+                 rate: float = 0.5,
+                 min_rate: float = 0.05,
+                 max_rate: float = 4.0,
+                 burst: float = 2.0,
+                 increase: float = 0.05,
+                 decrease: float = 0.5,
+                 base_backoff: float = 2.0,
+                 max_backoff: float = 120.0):
+        """Rates are page requests per second across all workers"""
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self._cond = threading.Condition()
+        self._tokens = burst
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._consecutive_failures = 0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self) -> float:
+        """Block until a request may be sent, returns seconds waited"""
+        start = time.monotonic()
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    self._cond.wait(self._blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return time.monotonic() - start
+
+                self._cond.wait((1 - self._tokens) / self.rate)
+
+    def record_success(self):
+        with self._cond:
+            self._consecutive_failures = 0
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def record_failure(self, reason: str = "error"):
+        """reason: 'timeout', 'blocked', 'challenge', ... (for logging)"""
+        with self._cond:
+            self._consecutive_failures += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+
+            backoff = min(self.max_backoff, self.base_backoff * 2 ** (self._consecutive_failures - 1))
+            backoff *= random.uniform(0.75, 1.25)
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + backoff)
+            self._tokens = 0
+            self._last_refill = now
+            self._cond.notify_all()
+
+        logger.warning(f"🐢 Backing off {backoff:.1f}s after {reason} "
+                       f"(rate now {self.rate:.2f} req/s, {self._consecutive_failures} failures in a row)")
+
+    def state(self) -> Dict[str, float]:
+        with self._cond:
+            return {
+                'rate': self.rate,
+                'tokens': self._tokens,
+                'backoff_remaining': max(0.0, self._blocked_until - time.monotonic()),
+                'consecutive_failures': self._consecutive_failures,
+            }
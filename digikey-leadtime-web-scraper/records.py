@@ -0,0 +1,154 @@
+"""
+Memory-lean result representation for large batches
+Typed slotted records and an array-backed ResultStore; dates are stored as
+ordinal ints and only turned back into the scrape_part() dict shape on access.
+"""
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, Iterator, Optional, Tuple
+import sys
+
+
+DATE_FORMAT = "%d.%m.%Y"
+
+
+def ship_date_to_ordinal(ship_date: str) -> int:
+    return datetime.strptime(ship_date, DATE_FORMAT).toordinal()
+
+
+def ordinal_to_ship_date(ordinal: int) -> str:
+    return date.fromordinal(ordinal).strftime(DATE_FORMAT)
+
+
+def _lead_time_dict(qty: int, ordinal: int) -> Dict[str, any]:
+    ship_date = ordinal_to_ship_date(ordinal)
+    # raw_text is rebuilt on demand instead of being stored per entry
+    return {'qty': qty, 'ship_date': ship_date, 'raw_text': f"QTY: {qty}, Date: {ship_date}"}
+
+
+@dataclass(slots=True, frozen=True)
+class LeadTimeEntry:
+    qty: int
+    ship_day: int  # date.toordinal()
+
+    @classmethod
+    def from_dict(cls, entry: Dict[str, any]) -> "LeadTimeEntry":
+        return cls(int(entry['qty']), ship_date_to_ordinal(entry['ship_date']))
+
+    def to_dict(self) -> Dict[str, any]:
+        return _lead_time_dict(self.qty, self.ship_day)
+
+
+@dataclass(slots=True, frozen=True)
+class PartResult:
+    part_number: str
+    success: bool
+    in_stock: bool
+    current_quantity: int
+    lead_times: Tuple[LeadTimeEntry, ...]
+    error: Optional[str]
+    timestamp: float  # epoch seconds
+
+    @classmethod
+    def from_dict(cls, result: Dict[str, any]) -> "PartResult":
+        return cls(
+            part_number=sys.intern(result['part_number']),
+            success=bool(result['success']),
+            in_stock=bool(result['in_stock']),
+            current_quantity=int(result['current_quantity']),
+            lead_times=tuple(LeadTimeEntry.from_dict(e) for e in result.get('lead_times') or ()),
+            error=sys.intern(result['error']) if result.get('error') else None,
+            timestamp=datetime.fromisoformat(result['timestamp']).timestamp(),
+        )
+
+    def to_dict(self) -> Dict[str, any]:
+        return {
+            'part_number': self.part_number,
+            'success': self.success,
+            'in_stock': self.in_stock,
+            'current_quantity': self.current_quantity,
+            'lead_times': [entry.to_dict() for entry in self.lead_times],
+            'error': self.error,
+            'timestamp': datetime.fromtimestamp(self.timestamp).isoformat(),
+        }
+
+
+_SUCCESS = 1
+_IN_STOCK = 2
+
+
+class ResultStore:
+    """
+    Append-only columnar store of scrape_part() results.
+    Iterating or indexing yields the usual result dicts, built on the fly.
+    """
+
+    def __init__(self):
+        self._part_numbers = []
+        self._flags = array('B')
+        self._quantities = array('q')
+        self._timestamps = array('d')
+        self._lead_start = array('L', [0])  # lead rows of result i: [start[i], start[i + 1])
+        self._lead_qty = array('q')
+        self._lead_day = array('l')
+        self._errors: Dict[int, str] = {}  # sparse - most results have none
+
+    def append(self, result: Dict[str, any]):
+        index = len(self._part_numbers)
+        self._part_numbers.append(sys.intern(result['part_number']))
+        self._flags.append((_SUCCESS if result['success'] else 0) | (_IN_STOCK if result['in_stock'] else 0))
+        self._quantities.append(int(result['current_quantity']))
+        self._timestamps.append(datetime.fromisoformat(result['timestamp']).timestamp())
+
+        for entry in result.get('lead_times') or ():
+            self._lead_qty.append(int(entry['qty']))
+            self._lead_day.append(ship_date_to_ordinal(entry['ship_date']))
+        self._lead_start.append(len(self._lead_qty))
+
+        if result.get('error'):
+            self._errors[index] = sys.intern(result['error'])
+
+    def extend(self, results):
+        for result in results:
+            self.append(result)
+
+    def __len__(self) -> int:
+        return len(self._part_numbers)
+
+    def __getitem__(self, index: int) -> Dict[str, any]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.record(index).to_dict()
+
+    def __iter__(self) -> Iterator[Dict[str, any]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def record(self, index: int) -> PartResult:
+        start, end = self._lead_start[index], self._lead_start[index + 1]
+        flags = self._flags[index]
+        return PartResult(
+            part_number=self._part_numbers[index],
+            success=bool(flags & _SUCCESS),
+            in_stock=bool(flags & _IN_STOCK),
+            current_quantity=self._quantities[index],
+            lead_times=tuple(LeadTimeEntry(self._lead_qty[i], self._lead_day[i]) for i in range(start, end)),
+            error=self._errors.get(index),
+            timestamp=self._timestamps[index],
+        )
+
+    def successful(self) -> int:
+        """Count of successful results without materializing dicts"""
+        return sum(1 for flags in self._flags if flags & _SUCCESS)
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the store"""
+        arrays = (self._flags, self._quantities, self._timestamps, self._lead_start, self._lead_qty, self._lead_day)
+        total = sum(a.itemsize * len(a) for a in arrays)
+        total += sys.getsizeof(self._part_numbers) + sys.getsizeof(self._errors)
+        # Interned strings are shared, count each distinct one once
+        total += sum(sys.getsizeof(s) for s in set(self._part_numbers))
+        return total
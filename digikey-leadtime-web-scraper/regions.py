@@ -0,0 +1,213 @@
+"""
+Regional Digi-Key sites and a scraper that queries several of them at once
+A Region bundles what differs per site: search URL, date formats, stock
+phrases and cookie-banner selectors. MultiRegionScraper runs one scraper per
+region in parallel and merges their results into one per-part result.
+"""
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import logging
+
+from cache import ResultCache
+from parsing import DATE_FORMATS, IN_STOCK_PHRASES, OUT_OF_STOCK_PHRASES, DateParser
+from pool import failed_result
+
+
+logger = logging.getLogger(__name__)
+
+
+GERMAN_MONTH_NAMES = {
+    name: number
+    for number, names in enumerate([
+        ("januar", "jan"), ("februar", "feb"), ("märz", "mär", "maerz"), ("april", "apr"),
+        ("mai",), ("juni", "jun"), ("juli", "jul"), ("august", "aug"),
+        ("september", "sep", "sept"), ("oktober", "okt"), ("november", "nov"), ("dezember", "dez"),
+    ], start=1)
+    for name in names
+}
+
+
+def _formats_first(*preferred: str) -> Tuple[str, ...]:
+    """DATE_FORMATS with the site's own formats tried first (decides d/m vs m/d)"""
+    return tuple(preferred) + tuple(fmt for fmt in DATE_FORMATS if fmt not in preferred)
+
+
+@dataclass(frozen=True)
+class Region:
+    """One regional Digi-Key site"""
+    code: str
+    search_url: str
+    date_formats: Tuple[str, ...] = tuple(DATE_FORMATS)
+    month_names: Dict[str, int] = field(default_factory=dict)
+    in_stock_phrases: Tuple[str, ...] = IN_STOCK_PHRASES
+    out_of_stock_phrases: Tuple[str, ...] = OUT_OF_STOCK_PHRASES
+    cookie_selectors: Tuple[str, ...] = ()
+    accept_language: str = "en-US,en;q=0.9"
+
+    def date_parser(self) -> DateParser:
+        return DateParser(self.date_formats, month_names=self.month_names)
+
+
+REGIONS: Dict[str, Region] = {
+    'de': Region(
+        code='de',
+        search_url="https://www.digikey.de/en/products/result?keywords={}",
+        date_formats=_formats_first("%d.%m.%Y", "%d. %B %Y"),
+        month_names=GERMAN_MONTH_NAMES,
+        # The /en/ site mostly answers in English, German phrases cover /de/ pages
+        in_stock_phrases=IN_STOCK_PHRASES + ("auf lager",),
+        out_of_stock_phrases=OUT_OF_STOCK_PHRASES + ("nicht auf lager", "nicht verfügbar"),
+        cookie_selectors=(
+            "//button[contains(text(), 'Alle akzeptieren')]",
+            "//button[contains(text(), 'Akzeptieren')]",
+        ),
+        accept_language="en-US,en;q=0.9,de;q=0.8",
+    ),
+    'us': Region(
+        code='us',
+        search_url="https://www.digikey.com/en/products/result?keywords={}",
+        date_formats=_formats_first("%m/%d/%Y", "%B %d, %Y"),
+    ),
+    'ca': Region(
+        code='ca',
+        search_url="https://www.digikey.ca/en/products/result?keywords={}",
+        date_formats=_formats_first("%m/%d/%Y", "%B %d, %Y"),
+    ),
+    'uk': Region(
+        code='uk',
+        search_url="https://www.digikey.co.uk/en/products/result?keywords={}",
+        date_formats=_formats_first("%d/%m/%Y", "%d %B %Y"),
+        accept_language="en-GB,en;q=0.9",
+    ),
+}
+
+DEFAULT_REGION = 'de'
+
+
+def get_region(code: str) -> Region:
+    try:
+        return REGIONS[code.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown region: {code} (known: {', '.join(REGIONS)})")
+
+
+def merge_region_results(part_number: str, by_region: Dict[str, Dict[str, any]]) -> Dict[str, any]:
+    """
+    One scrape_part()-shaped result from per-region results (in region order).
+    Stock is the best any site reports; lead times come from the first region
+    that has them. The per-region results are kept under 'regions'.
+    """
+    successful = [r for r in by_region.values() if r['success']]
+    lead_times = next((r['lead_times'] for r in successful if r['lead_times']), [])
+    errors = [f"{code}: {r['error']}" for code, r in by_region.items() if r.get('error')]
+
+    return {
+        'part_number': part_number,
+        'success': bool(successful),
+        'in_stock': any(r['in_stock'] for r in successful),
+        'current_quantity': max((r['current_quantity'] for r in successful), default=0),
+        'lead_times': lead_times,
+        'error': None if successful else "; ".join(errors) or "No region succeeded",
+        'timestamp': datetime.now().isoformat(),
+        'regions': by_region,
+    }
+
+
+class MultiRegionScraper:
+    """
+    Scrapes the same part on several regional sites concurrently.
+    Exposes setup_driver/warm_up/scrape_part/close so it drops into ScraperPool.
+    """
+
+    def __init__(self, scraper_factory: Callable[[Region], any],
+                 regions: Iterable[str] = (DEFAULT_REGION, 'us'),
+                 timeout: Optional[float] = None,
+                 cache: Optional[ResultCache] = None):
+        """
+        scraper_factory(region) returns a new, not yet started scraper for that
+        site. timeout caps the wait for the slowest region; a region that
+        misses it counts as failed for that part, and its scraper - still busy
+        with that part - is closed and replaced by a fresh one. cache holds
+        merged results - don't give the region scrapers a cache, their results
+        share one key.
+        """
+        self.regions: List[Region] = [get_region(code) for code in regions]
+        if not self.regions:
+            raise ValueError("At least one region is required")
+        self.timeout = timeout
+        self.cache = cache
+        self.scraper_factory = scraper_factory
+        self.scrapers = {region.code: scraper_factory(region) for region in self.regions}
+        # Headroom for threads still blocked in a timed-out scraper until its close() lands
+        self._executor = ThreadPoolExecutor(max_workers=len(self.regions) * 2, thread_name_prefix="region")
+
+    @property
+    def starts_lazily(self) -> bool:
+        """Cached parts, or regions that all start Chrome on demand, need no eager start"""
+        return self.cache is not None or all(getattr(s, 'starts_lazily', False) for s in self.scrapers.values())
+
+    def setup_driver(self):
+        """Start every region's Chrome in parallel"""
+        futures = [self._executor.submit(scraper.setup_driver) for scraper in self.scrapers.values()]
+        for future in futures:
+            future.result()
+
+    def warm_up(self):
+        """Warm every region's scraper in parallel"""
+        futures = [self._executor.submit(scraper.warm_up) for scraper in self.scrapers.values()]
+        for future in futures:
+            future.result()
+
+    def scrape_part(self, part_number: str, max_age: Optional[float] = None) -> Dict[str, any]:
+        if self.cache:
+            cached = self.cache.get(part_number, max_age=max_age)
+            if cached:
+                return cached
+
+        logger.info(f"🌍 {part_number}: checking {', '.join(self.scrapers)}")
+        futures = {
+            code: self._executor.submit(scraper.scrape_part, part_number, max_age=max_age)
+            for code, scraper in self.scrapers.items()
+        }
+
+        by_region = {}
+        for code, future in futures.items():
+            try:
+                by_region[code] = future.result(timeout=self.timeout)
+            except FutureTimeout:
+                logger.warning(f"⚠️ {part_number} [{code}]: timed out after {self.timeout}s")
+                by_region[code] = failed_result(part_number, f"Region {code} timed out after {self.timeout}s")
+                self._replace_scraper(code)
+            except Exception as e:
+                logger.warning(f"⚠️ {part_number} [{code}]: {str(e) or type(e).__name__}")
+                by_region[code] = failed_result(part_number, f"Region {code} failed: {str(e) or type(e).__name__}")
+
+        result = merge_region_results(part_number, by_region)
+        if self.cache:
+            self.cache.put(result)
+
+        # Change events from incremental refresh (delta.py), tagged with their site
+        changes = [dict(event, region=code) for code, r in by_region.items() for event in r.get('changes') or []]
+        if changes:
+            result['changes'] = changes
+        return result
+
+    def _replace_scraper(self, code: str):
+        """Swap in a fresh scraper; closing the busy one aborts its blocked driver call"""
+        busy = self.scrapers[code]
+        self.scrapers[code] = self.scraper_factory(get_region(code))
+        self._executor.submit(self._close_scraper, busy)
+
+    @staticmethod
+    def _close_scraper(scraper):
+        try:
+            scraper.close()
+        except Exception as e:
+            logger.debug(f"Region scraper close: {str(e)}")
+
+    def close(self):
+        for scraper in self.scrapers.values():
+            self._close_scraper(scraper)
+        self._executor.shutdown(wait=False, cancel_futures=True)
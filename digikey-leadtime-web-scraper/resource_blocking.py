@@ -0,0 +1,110 @@
+"""
+Request blocking for Chrome via CDP Network.setBlockedURLs
+Drops images, media, fonts and third-party trackers, and accounts for the
+bytes loaded vs. (estimated) saved per page from performance-log events.
+"""
+from typing import Dict, Iterable, List, Optional
+import logging
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+IMAGE_PATTERNS = ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*"]
+MEDIA_PATTERNS = ["*.mp4*", "*.webm*", "*.mp3*", "*.m3u8*"]
+FONT_PATTERNS = ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"]
+TRACKER_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*facebook.net*",
+    "*connect.facebook.com*",
+    "*bat.bing.com*",
+    "*hotjar.com*",
+    "*linkedin.com/px*",
+    "*snap.licdn.com*",
+    "*demdex.net*",
+    "*omtrdc.net*",
+    "*adobedtm.com*",
+    "*quantummetric.com*",
+    "*clarity.ms*",
+]
+
+# Rough transfer sizes used to estimate what a blocked request would have cost
+ESTIMATED_BYTES = {
+    'Image': 25 * 1024,
+    'Media': 500 * 1024,
+    'Font': 40 * 1024,
+    'Script': 60 * 1024,
+    'Other': 10 * 1024,
+}
+
+
+class ResourceBlocker:
+    """
+    Installs URL block patterns on a driver and reports bytes saved per page.
+    Use one per scraper - its counters are per driver.
+    """
+
+    def __init__(self, block_images: bool = True, block_media: bool = True,
+                 block_fonts: bool = True, block_trackers: bool = True,
+                 extra_patterns: Iterable[str] = ()):
+        self.patterns: List[str] = []
+        if block_images:
+            self.patterns += IMAGE_PATTERNS
+        if block_media:
+            self.patterns += MEDIA_PATTERNS
+        if block_fonts:
+            self.patterns += FONT_PATTERNS
+        if block_trackers:
+            self.patterns += TRACKER_PATTERNS
+        self.patterns += list(extra_patterns)
+
+        self._lock = threading.Lock()
+        self._types: Dict[str, str] = {}
+        self._reset_page()
+
+    def _reset_page(self):
+        self._types = {}
+        self.loaded_bytes = 0
+        self.loaded_requests = 0
+        self.blocked_requests = 0
+        self.estimated_saved_bytes = 0
+
+    def install(self, driver):
+        """Enable blocking on this driver (call again after a driver restart)"""
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.patterns})
+        logger.info(f"🚫 Blocking {len(self.patterns)} URL patterns")
+
+    def on_event(self, method: str, params: Dict):
+        """PerformanceLog listener"""
+        with self._lock:
+            if method == 'Network.requestWillBeSent':
+                self._types[params.get('requestId')] = params.get('type', 'Other')
+            elif method == 'Network.loadingFinished':
+                self.loaded_requests += 1
+                self.loaded_bytes += int(params.get('encodedDataLength', 0))
+            elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                resource_type = params.get('type') or self._types.get(params.get('requestId'), 'Other')
+                self.blocked_requests += 1
+                self.estimated_saved_bytes += ESTIMATED_BYTES.get(resource_type, ESTIMATED_BYTES['Other'])
+
+    def page_report(self, label: Optional[str] = None) -> Dict[str, int]:
+        """Return and log counters since the last report, then reset them"""
+        with self._lock:
+            report = {
+                'loaded_requests': self.loaded_requests,
+                'loaded_bytes': self.loaded_bytes,
+                'blocked_requests': self.blocked_requests,
+                'estimated_saved_bytes': self.estimated_saved_bytes,
+            }
+            self._reset_page()
+
+        logger.info(
+            f"🚫 {label or 'Page'}: loaded {report['loaded_bytes'] / 1024:.0f} KB in "
+            f"{report['loaded_requests']} requests, blocked {report['blocked_requests']} "
+            f"(~{report['estimated_saved_bytes'] / 1024:.0f} KB saved)"
+        )
+        return report
@@ -0,0 +1,100 @@
+"""
+Adaptive selector ordering
+Records hits, misses and time-to-match per XPath candidate and ranks each
+lookup's candidates so the one that usually wins is tried first. Stats are
+kept in a JSON file so the ordering survives restarts.
+"""
+from typing import Dict, List, Optional
+import json
+import logging
+import os
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+class SelectorRegistry:
+    """Thread-safe per-group selector stats - share one instance between workers"""
+
+    def __init__(self, path: Optional[str] = None, max_tries: int = 200):
+        """
+        path persists stats across runs (None keeps them in memory).
+        Counts are halved once a selector reaches max_tries, so the ranking
+        follows Digi-Key markup changes instead of the whole history.
+        """
+        self.path = path
+        self.max_tries = max_tries
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Dict[str, float]]] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self._stats = json.load(f)
+                logger.info(f"🧭 Loaded selector stats for {len(self._stats)} lookups from {path}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ Ignoring unreadable selector stats {path}: {e}")
+
+    def _score(self, entry: Optional[Dict[str, float]]):
+        if not entry:
+            return (0.5, float('-inf'))  # untried: neutral hit rate, after proven ones
+        hits, misses = entry['hits'], entry['misses']
+        hit_rate = (hits + 1) / (hits + misses + 2)
+        latency = entry['seconds'] / hits if hits else float('inf')
+        return (hit_rate, -latency)
+
+    def rank(self, group: str, candidates: List[str]) -> List[str]:
+        """Candidates best first; unknown ones keep their given order"""
+        with self._lock:
+            stats = self._stats.get(group, {})
+            scores = {c: self._score(stats.get(c)) for c in candidates}
+        return sorted(candidates, key=lambda c: scores[c], reverse=True)
+
+    def record(self, group: str, selector: str, hit: bool, seconds: float = 0.0):
+        with self._lock:
+            entry = self._stats.setdefault(group, {}).setdefault(
+                selector, {'hits': 0, 'misses': 0, 'seconds': 0.0}
+            )
+            if hit:
+                entry['hits'] += 1
+                entry['seconds'] += seconds
+            else:
+                entry['misses'] += 1
+
+            if entry['hits'] + entry['misses'] >= self.max_tries:
+                for key in entry:
+                    entry[key] /= 2
+
+    def record_lookup(self, group: str, ranked: List[str], winner: Optional[str], seconds: float):
+        """Winner gets a hit; everything ranked before it (or all, if none won) a miss"""
+        for selector in ranked:
+            if selector == winner:
+                self.record(group, selector, True, seconds)
+                return
+            self.record(group, selector, False)
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        with self._lock:
+            return json.loads(json.dumps(self._stats))
+
+    def log_summary(self):
+        summary = self.summary()
+        if not summary:
+            return
+        logger.info("🧭 Selector stats (best first)")
+        for group, stats in sorted(summary.items()):
+            logger.info(f"  {group}")
+            for selector in self.rank(group, list(stats)):
+                entry = stats[selector]
+                tries = entry['hits'] + entry['misses']
+                avg = entry['seconds'] / entry['hits'] if entry['hits'] else 0.0
+                logger.info(f"    hits={entry['hits']:.0f}/{tries:.0f} avg={avg:.2f}s  {selector}")
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with self._lock:
+            with open(tmp_path, "w") as f:
+                json.dump(self._stats, f, indent=1)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,286 @@
+"""
+Long-lived local HTTP service over a pool of warm scrapers
+
+    python service.py [--port 8080] [--workers 2] [--headless] [--cache digikey_cache.sqlite3]
+                      [--leadtime-api [digikey_leadtime_api.json]]
+
+GET  /parts/{mpn}   scrape_part() result as JSON
+POST /parts         {"parts": [...]} -> {"results": [...]} in request order
+GET  /health        live workers and queue depth
+GET  /metrics       per-stage Prometheus metrics
+
+Chrome is started and the cookie banner cleared once per worker at startup,
+so a lookup costs one page flow. When the queue is full new work is refused
+with 503 and a Retry-After estimate instead of piling up.
+"""
+from concurrent.futures import CancelledError, TimeoutError as FutureTimeout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import unquote
+import argparse
+import json
+import logging
+import math
+import os
+import queue
+import time
+
+from cache import ResultCache
+from dedup import canonical_part
+from leadtime_api import LeadTimeApiClient
+from metrics import StageMetrics
+from pool import ScraperPool, failed_result
+from profiles import worker_profile_dir
+from rate_limit import AdaptiveRateLimiter
+from resource_blocking import ResourceBlocker
+from selector_registry import SelectorRegistry
+from url_index import DetailUrlIndex
+
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class ServiceBusy(Exception):
+    """Raised when the scrape queue can't take more work"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Queue full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class ServiceStopping(Exception):
+    """Raised when queued work was cancelled because the pool is shutting down"""
+
+
+class ScraperService:
+    """Admission control and result collection in front of a warm ScraperPool"""
+
+    def __init__(self, pool: ScraperPool, metrics: StageMetrics,
+                 max_queue: int = 500, max_batch: int = 200, request_timeout: float = 300):
+        """
+        max_queue should match the pool's queue_size; a batch may not hold
+        more distinct parts than that. request_timeout caps how long a request waits; a part
+        still running afterwards finishes in the background (and lands in the
+        cache, if the scrapers have one).
+        """
+        self.pool = pool
+        self.metrics = metrics
+        self.max_queue = max_queue
+        self.max_batch = max_batch
+        self.request_timeout = request_timeout
+
+    def retry_after(self, extra: int = 1) -> int:
+        """Seconds until the queue has likely drained enough for `extra` more parts"""
+        mean = next((row['mean'] for row in self.metrics.summary() if row['stage'] == "scrape_part"), 0.0)
+        per_part = mean or 20.0
+        workers = max(1, self.pool.workers_alive())
+        return max(1, math.ceil((self.pool.pending() + extra - self.max_queue) * per_part / workers))
+
+    def lookup(self, part_number: str) -> Dict[str, any]:
+        try:
+            future = self.pool.submit(part_number, block=False)
+        except queue.Full:
+            raise ServiceBusy(self.retry_after())
+        try:
+            return future.result(timeout=self.request_timeout)
+        except queue.Full:
+            # Coalesced onto a submit that lost the race for the last queue slot
+            raise ServiceBusy(self.retry_after())
+        except CancelledError:
+            raise ServiceStopping("Service is shutting down")
+
+    def lookup_many(self, parts: List[str]) -> List[Dict[str, any]]:
+        # Equivalent spellings share one queue slot (the pool coalesces them)
+        unique = len({canonical_part(part_number) for part_number in parts})
+        if len(parts) > self.max_batch or unique > self.max_queue:
+            raise ValueError(f"At most {min(self.max_batch, self.max_queue)} parts per request")
+        if self.pool.pending() + unique > self.max_queue:
+            raise ServiceBusy(self.retry_after(unique))
+
+        futures = []
+        for part_number in parts:
+            try:
+                futures.append(self.pool.submit(part_number, block=False))
+            except queue.Full:
+                futures.append(None)  # lost the race for the last slots
+
+        deadline = time.monotonic() + self.request_timeout
+        results = []
+        for part_number, future in zip(parts, futures):
+            if future is None:
+                results.append(failed_result(part_number, "Queue full"))
+                continue
+            try:
+                results.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except FutureTimeout:
+                results.append(failed_result(part_number, f"Timed out after {self.request_timeout:.0f}s"))
+            except queue.Full:
+                results.append(failed_result(part_number, "Queue full"))
+            except CancelledError:
+                results.append(failed_result(part_number, "Service is shutting down"))
+        return results
+
+    def health(self) -> Dict[str, any]:
+        return {
+            'workers': self.pool.workers,
+            'workers_alive': self.pool.workers_alive(),
+            'queued': self.pool.pending(),
+            'max_queue': self.max_queue,
+        }
+
+
+def _parse_parts(body: bytes) -> Optional[List[str]]:
+    """Part list from {"parts": [...]} or a bare JSON list, None if malformed"""
+    try:
+        payload = json.loads(body or b"null")
+    except ValueError:
+        return None
+    parts = payload.get('parts') if isinstance(payload, dict) else payload
+    if not isinstance(parts, list) or not all(isinstance(p, str) and p.strip() for p in parts):
+        return None
+    return [p.strip() for p in parts]
+
+
+def make_server(service: ScraperService, host: str = "127.0.0.1", port: int = 8080) -> ThreadingHTTPServer:
+    """HTTP server for service; call serve_forever() on the result"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send_json(self, status: int, payload, headers: Optional[Dict[str, str]] = None):
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_busy(self, e: ServiceBusy):
+            self._send_json(503, {'error': str(e)}, {"Retry-After": str(e.retry_after)})
+
+        def do_GET(self):
+            path = self.path.split('?')[0]
+
+            if path == "/health":
+                health = service.health()
+                self._send_json(200 if health['workers_alive'] else 503, health)
+                return
+
+            if path == "/metrics":
+                body = service.metrics.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+
+            if not path.startswith("/parts/") or not unquote(path[len("/parts/"):]).strip():
+                self._send_json(404, {'error': "Not found"})
+                return
+
+            part_number = unquote(path[len("/parts/"):]).strip()
+            try:
+                self._send_json(200, service.lookup(part_number))
+            except ServiceBusy as e:
+                self._send_busy(e)
+            except ServiceStopping as e:
+                self._send_json(503, {'error': str(e)})
+            except FutureTimeout:
+                self._send_json(504, {'error': f"Timed out after {service.request_timeout:.0f}s"})
+
+        def do_POST(self):
+            if self.path.split('?')[0] != "/parts":
+                self._send_json(404, {'error': "Not found"})
+                return
+
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_BODY_BYTES:
+                self._send_json(413, {'error': "Body too large"})
+                return
+
+            parts = _parse_parts(self.rfile.read(length))
+            if parts is None:
+                self._send_json(400, {'error': 'Expected {"parts": ["MPN", ...]}'})
+                return
+            try:
+                self._send_json(200, {'results': service.lookup_many(parts)})
+            except ServiceBusy as e:
+                self._send_busy(e)
+            except ValueError as e:
+                self._send_json(413, {'error': str(e)})
+
+        def log_message(self, format, *args):
+            logger.debug(f"service: {format % args}")
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Digi-Key lead-time lookup service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-queue", type=int, default=500)
+    parser.add_argument("--max-batch", type=int, default=200)
+    parser.add_argument("--request-timeout", type=float, default=300)
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--http-fast-path", action="store_true")
+    parser.add_argument("--cache", help="result cache path (SQLite)")
+    parser.add_argument("--url-index", help="detail-URL index path (SQLite)")
+    parser.add_argument("--profile-root", help="per-worker Chrome profiles + cookie jars")
+    parser.add_argument("--selectors", help="learned selector stats path (JSON)")
+    parser.add_argument("--block-resources", action="store_true")
+    parser.add_argument("--leadtime-api", nargs="?", const="digikey_leadtime_api.json",
+                        help="replay the lead-time request; template file loaded or saved after capture")
+    args = parser.parse_args()
+
+    from main import DigikeyLeadTimeScraper
+
+    metrics = StageMetrics()
+    rate_limiter = AdaptiveRateLimiter()
+    cache = ResultCache(args.cache) if args.cache else None
+    url_index = DetailUrlIndex(args.url_index) if args.url_index else None
+    selectors = SelectorRegistry(args.selectors)
+
+    def make_scraper(worker_id: int) -> DigikeyLeadTimeScraper:
+        profile_dir = worker_profile_dir(args.profile_root, worker_id)
+        return DigikeyLeadTimeScraper(
+            headless=args.headless,
+            metrics=metrics,
+            rate_limiter=rate_limiter,
+            http_fast_path=args.http_fast_path,
+            leadtime_api=LeadTimeApiClient(template_path=args.leadtime_api) if args.leadtime_api else None,
+            cache=cache,
+            url_index=url_index,
+            profile_dir=profile_dir,
+            cookie_jar=os.path.join(profile_dir, "cookies.json") if profile_dir else None,
+            resource_blocker=ResourceBlocker() if args.block_resources else None,
+            selectors=selectors
+        )
+
+    pool = ScraperPool(make_scraper, workers=args.workers, queue_size=args.max_queue, warm=True)
+    service = ScraperService(pool, metrics, max_queue=args.max_queue, max_batch=args.max_batch,
+                             request_timeout=args.request_timeout)
+    server = make_server(service, args.host, args.port)
+
+    pool.start()
+    logger.info(f"🌐 Serving on http://{args.host}:{args.port} ({args.workers} warm workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("⏹️ Shutting down")
+    finally:
+        server.server_close()
+        pool.close(cancel_pending=True)
+        selectors.save()
+        if cache:
+            cache.close()
+        if url_index:
+            url_index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Streaming result sinks: JSONL, CSV and Parquet writers
+Each scrape_part() result is written as soon as it completes.
+"""
+from typing import Dict, Iterator, List
+import csv
+import json
+import logging
+import os
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+FLAT_COLUMNS = [
+    'part_number',
+    'success',
+    'in_stock',
+    'current_quantity',
+    'error',
+    'timestamp',
+    'lead_qty',
+    'ship_date',
+]
+
+
+def flatten_result(result: Dict[str, any]) -> Iterator[Dict[str, any]]:
+    """One row per lead-time entry; parts without lead times give one row with empty lead columns"""
+    base = {
+        'part_number': result['part_number'],
+        'success': bool(result['success']),
+        'in_stock': bool(result['in_stock']),
+        'current_quantity': int(result['current_quantity']),
+        'error': result.get('error'),
+        'timestamp': result['timestamp'],
+    }
+
+    lead_times = result.get('lead_times') or []
+    if not lead_times:
+        yield dict(base, lead_qty=None, ship_date=None)
+        return
+
+    for entry in lead_times:
+        yield dict(base, lead_qty=int(entry['qty']), ship_date=entry['ship_date'])
+
+
+class ResultSink:
+    """Base sink - thread-safe write() of one result dict"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def write(self, result: Dict[str, any]):
+        with self._lock:
+            self._write(result)
+
+    def _write(self, result: Dict[str, any]):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class JsonlSink(ResultSink):
+    """Line-buffered JSONL, one result dict per line (lead times nested)"""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, 'a', encoding='utf-8', buffering=1)
+
+    def _write(self, result: Dict[str, any]):
+        self._file.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class CsvSink(ResultSink):
+    """Flattened CSV, one row per lead-time entry"""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, 'a', newline='', encoding='utf-8', buffering=1)
+        self._writer = csv.DictWriter(self._file, fieldnames=FLAT_COLUMNS)
+        if write_header:
+            self._writer.writeheader()
+
+    def _write(self, result: Dict[str, any]):
+        self._writer.writerows(flatten_result(result))
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class ParquetSink(ResultSink):
+    """
+    Flattened Parquet, buffered into row groups of row_group_size rows (needs pyarrow).
+    Parquet files can't be appended to, so when path exists (e.g. a resumed
+    run) rows go to a new part file next to it: out.parquet, out.1.parquet, ...
+    """
+
+    def __init__(self, path: str, row_group_size: int = 10000):
+        path = self.part_path(path)
+        super().__init__(path)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("ParquetSink needs pyarrow: pip install pyarrow")
+
+        self._pa = pa
+        self.row_group_size = row_group_size
+        self.schema = pa.schema([
+            ('part_number', pa.string()),
+            ('success', pa.bool_()),
+            ('in_stock', pa.bool_()),
+            ('current_quantity', pa.int64()),
+            ('error', pa.string()),
+            ('timestamp', pa.string()),
+            ('lead_qty', pa.int64()),
+            ('ship_date', pa.string()),
+        ])
+        self._writer = pq.ParquetWriter(path, self.schema)
+        self._rows: List[Dict[str, any]] = []
+
+    @staticmethod
+    def part_path(path: str) -> str:
+        """path, or the first free numbered part file next to it"""
+        base, ext = os.path.splitext(path)
+        part = 0
+        while os.path.exists(path):
+            part += 1
+            path = f"{base}.{part}{ext}"
+        if part:
+            logger.info(f"📦 {base}{ext} exists, writing this run's rows to {path}")
+        return path
+
+    def _write(self, result: Dict[str, any]):
+        self._rows.extend(flatten_result(result))
+        if len(self._rows) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._rows:
+            return
+        table = self._pa.Table.from_pylist(self._rows, schema=self.schema)
+        self._writer.write_table(table)
+        logger.debug(f"Parquet: wrote row group of {len(self._rows)} rows")
+        self._rows = []
+
+    def close(self):
+        with self._lock:
+            self._flush()
+            self._writer.close()
+
+
+SINKS = {
+    '.jsonl': JsonlSink,
+    '.csv': CsvSink,
+    '.parquet': ParquetSink,
+}
+
+
+def open_sink(path: str) -> ResultSink:
+    """Sink chosen by file extension"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in SINKS:
+        raise ValueError(f"Unsupported output format: {path} (use {', '.join(SINKS)})")
+    return SINKS[ext](path)
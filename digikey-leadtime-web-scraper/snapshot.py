@@ -0,0 +1,63 @@
+"""
+Per-page DOM snapshot
+Pulls page_source over WebDriver at most once per navigation and derives
+the lowercased HTML, the parsed tree and sub-fragments from it lazily.
+"""
+from bs4 import BeautifulSoup
+from typing import Dict, Optional
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+_OUTER_HTML_JS = "var el = document.querySelector(arguments[0]); return el ? el.outerHTML : null;"
+
+
+class PageSnapshot:
+    """Lazy, cached views of the current page - discard it after navigating"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._html: Optional[str] = None
+        self._html_lower: Optional[str] = None
+        self._soup: Optional[BeautifulSoup] = None
+        self._title: Optional[str] = None
+        self._url: Optional[str] = None
+        self._fragments: Dict[str, Optional[str]] = {}
+
+    @property
+    def html(self) -> str:
+        if self._html is None:
+            self._html = self.driver.page_source
+            logger.debug(f"Snapshot: pulled {len(self._html):,} chars of page_source")
+        return self._html
+
+    @property
+    def html_lower(self) -> str:
+        if self._html_lower is None:
+            self._html_lower = self.html.lower()
+        return self._html_lower
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, 'html.parser')
+        return self._soup
+
+    @property
+    def title(self) -> str:
+        if self._title is None:
+            self._title = self.driver.title
+        return self._title
+
+    @property
+    def url(self) -> str:
+        if self._url is None:
+            self._url = self.driver.current_url
+        return self._url
+
+    def fragment(self, css_selector: str) -> Optional[str]:
+        """outerHTML of the first element matching css_selector (one script call, no full page pull)"""
+        if css_selector not in self._fragments:
+            self._fragments[css_selector] = self.driver.execute_script(_OUTER_HTML_JS, css_selector)
+        return self._fragments[css_selector]
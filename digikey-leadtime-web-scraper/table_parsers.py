@@ -0,0 +1,120 @@
+"""
+Lead-time table parsing with pluggable HTML backends
+selectolax and lxml are optional; BeautifulSoup (html.parser) is the fallback.
+"""
+from typing import Callable, Dict, List, Optional
+import logging
+import re
+
+from parsing import DateParser, parse_date
+
+
+logger = logging.getLogger(__name__)
+
+Tables = List[List[List[str]]]  # tables -> rows -> cell texts
+
+
+def _tables_selectolax(html: str) -> Tables:
+    from selectolax.lexbor import LexborHTMLParser
+
+    tables = []
+    for table in LexborHTMLParser(html).css('table'):
+        rows = []
+        for tr in table.css('tr'):
+            rows.append([cell.text().strip() for cell in tr.css('td, th')])
+        tables.append(rows)
+    return tables
+
+
+def _tables_lxml(html: str) -> Tables:
+    import lxml.html
+
+    tables = []
+    for table in lxml.html.fromstring(html).iter('table'):
+        rows = []
+        for tr in table.iter('tr'):
+            rows.append([cell.text_content().strip() for cell in tr.iter('td', 'th')])
+        tables.append(rows)
+    return tables
+
+
+def _tables_bs4(html: str) -> Tables:
+    from bs4 import BeautifulSoup
+
+    tables = []
+    for table in BeautifulSoup(html, 'html.parser').find_all('table'):
+        rows = []
+        for tr in table.find_all('tr'):
+            rows.append([cell.get_text().strip() for cell in tr.find_all(['td', 'th'])])
+        tables.append(rows)
+    return tables
+
+
+BACKENDS: Dict[str, Callable[[str], Tables]] = {
+    'selectolax': _tables_selectolax,
+    'lxml': _tables_lxml,
+    'bs4': _tables_bs4,
+}
+
+_MODULES = {'selectolax': 'selectolax.lexbor', 'lxml': 'lxml.html', 'bs4': 'bs4'}
+
+
+def available_backends() -> List[str]:
+    """Installed backends, fastest first"""
+    available = []
+    for name, module in _MODULES.items():
+        try:
+            __import__(module)
+            available.append(name)
+        except ImportError:
+            continue
+    return available
+
+
+def get_backend(name: Optional[str] = None) -> Callable[[str], Tables]:
+    """Named backend, or the fastest installed one"""
+    if name:
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown table backend: {name}")
+        return BACKENDS[name]
+
+    available = available_backends()
+    if not available:
+        raise ImportError("No HTML parser installed (need selectolax, lxml or beautifulsoup4)")
+    return BACKENDS[available[0]]
+
+
+def extract_lead_times(html: str, backend: Optional[str] = None,
+                       date_parser: Optional[DateParser] = None) -> List[Dict[str, any]]:
+    """Lead-time rows (qty, ship date) from the first table that yields any"""
+    parse = date_parser.parse if date_parser else parse_date
+    lead_time_data = []
+
+    for table_idx, rows in enumerate(get_backend(backend)(html)):
+        if len(rows) < 2:
+            continue
+
+        logger.debug(f"Processing table {table_idx} with {len(rows)} rows")
+
+        for cells in rows[1:]:
+            if len(cells) < 2:
+                continue
+            try:
+                qty = int(re.sub(r'[^\d]', '', cells[0]))
+                date_text = cells[1]
+                ship_date = parse(date_text)
+
+                if qty > 0 and ship_date:
+                    lead_time_data.append({
+                        'qty': qty,
+                        'ship_date': ship_date,
+                        'raw_text': f"QTY: {qty}, Date: {date_text}"
+                    })
+            except (ValueError, IndexError) as e:
+                logger.debug(f"Row parse error: {str(e)}")
+                continue
+
+        if lead_time_data:
+            break
+
+    return lead_time_data
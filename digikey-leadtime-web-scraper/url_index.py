@@ -0,0 +1,59 @@
+"""
+Persistent part number -> product detail URL index (SQLite)
+Lets later runs open the detail page directly and skip the search page.
+"""
+from typing import Optional
+import logging
+import sqlite3
+import threading
+import time
+
+from cache import normalize_key
+
+
+logger = logging.getLogger(__name__)
+
+
+class DetailUrlIndex:
+    """Resolved /products/detail/ URLs keyed by normalized part number, shared by all workers"""
+
+    def __init__(self, path: str = "digikey_urls.sqlite3"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS detail_urls (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                resolved_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, part_number: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url FROM detail_urls WHERE key = ?", (normalize_key(part_number),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, part_number: str, url: str):
+        if "/products/detail/" not in url:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO detail_urls (key, url, resolved_at) VALUES (?, ?, ?)",
+                (normalize_key(part_number), url, time.time())
+            )
+            self._conn.commit()
+
+    def invalidate(self, part_number: str):
+        logger.info(f"🗑️ Dropping stale detail URL for {part_number}")
+        with self._lock:
+            self._conn.execute("DELETE FROM detail_urls WHERE key = ?", (normalize_key(part_number),))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
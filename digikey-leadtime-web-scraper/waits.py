@@ -0,0 +1,191 @@
+"""
+Event-driven waits for the scrape pipeline
+Replaces fixed time.sleep pacing with WebDriverWait on element, DOM-mutation
+and network-idle signals, and keeps per-step timing stats.
+"""
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+# Installs a MutationObserver plus fetch/XHR in-flight counters once per document.
+# Returns [ms since last DOM mutation, in-flight requests, readyState].
+_PROBE_JS = """
+var s = window.__dkWait;
+if (!s) {
+    s = window.__dkWait = {lastMutation: performance.now(), inflight: 0};
+    new MutationObserver(function() { s.lastMutation = performance.now(); })
+        .observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    var origFetch = window.fetch;
+    if (origFetch) {
+        window.fetch = function() {
+            s.inflight++;
+            return origFetch.apply(this, arguments).finally(function() { s.inflight--; });
+        };
+    }
+    var origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        s.inflight++;
+        this.addEventListener('loadend', function() { s.inflight--; });
+        return origSend.apply(this, arguments);
+    };
+}
+return [performance.now() - s.lastMutation, s.inflight, document.readyState];
+"""
+
+
+# Evaluates candidate XPaths in the given order in one round trip.
+# Returns [index of the first candidate with a (clickable) match, element] or null.
+_FIRST_MATCH_JS = """
+var xpaths = arguments[0], clickable = arguments[1];
+for (var i = 0; i < xpaths.length; i++) {
+    var found;
+    try {
+        found = document.evaluate(xpaths[i], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    } catch (e) {
+        continue;
+    }
+    for (var j = 0; j < found.snapshotLength; j++) {
+        var el = found.snapshotItem(j);
+        if (!clickable) return [i, el];
+        if (el.getClientRects().length && !el.disabled && getComputedStyle(el).visibility !== 'hidden') {
+            return [i, el];
+        }
+    }
+}
+return null;
+"""
+
+
+class StepStats:
+    """Per-step wait timing: time actually waited vs. the fixed sleep it replaced; shareable"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._steps: Dict[str, Dict[str, float]] = {}
+
+    def record(self, step: str, waited: float, replaced: float, timed_out: bool = False):
+        with self._lock:
+            entry = self._steps.setdefault(step, {
+                'calls': 0, 'waited': 0.0, 'replaced': 0.0, 'timeouts': 0
+            })
+            entry['calls'] += 1
+            entry['waited'] += waited
+            entry['replaced'] += replaced
+            if timed_out:
+                entry['timeouts'] += 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Copy of stats per step, with 'saved' = replaced sleep - actual wait"""
+        with self._lock:
+            summary = {}
+            for step, entry in self._steps.items():
+                summary[step] = dict(entry, saved=entry['replaced'] - entry['waited'])
+            return summary
+
+    def log_summary(self):
+        summary = self.summary()
+        if not summary:
+            return
+        total_saved = sum(entry['saved'] for entry in summary.values())
+        logger.info(f"⏱️ Wait stats (dead time removed: {total_saved:.1f}s)")
+        for step, entry in sorted(summary.items()):
+            logger.info(
+                f"  {step:<28} calls={entry['calls']:<4} waited={entry['waited']:.2f}s "
+                f"replaced={entry['replaced']:.2f}s saved={entry['saved']:.2f}s "
+                f"timeouts={entry['timeouts']}"
+            )
+
+
+class PageWaiter:
+    """Waits that return as soon as the page is ready instead of sleeping"""
+
+    def __init__(self, driver, timeout: float = 15, poll: float = 0.05,
+                 stats: Optional[StepStats] = None):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll = poll
+        self.stats = stats or StepStats()
+
+    def until(self, step: str, condition: Callable, timeout: Optional[float] = None,
+              replaces: float = 0.0, required: bool = True):
+        """
+        Wait for an expected condition. With required=False a timeout is
+        recorded and None is returned instead of raising.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        try:
+            value = WebDriverWait(self.driver, timeout, poll_frequency=self.poll).until(condition)
+            self.stats.record(step, time.perf_counter() - start, replaces)
+            return value
+        except TimeoutException:
+            self.stats.record(step, time.perf_counter() - start, replaces, timed_out=True)
+            if required:
+                raise
+            logger.debug(f"Wait timed out: {step}")
+            return None
+
+    def element(self, step: str, locator, timeout: Optional[float] = None,
+                replaces: float = 0.0, clickable: bool = False, required: bool = True):
+        """Wait for an element to be present (or clickable)"""
+        condition = EC.element_to_be_clickable(locator) if clickable else EC.presence_of_element_located(locator)
+        return self.until(step, condition, timeout, replaces, required)
+
+    def first(self, step: str, xpaths: List[str], timeout: Optional[float] = None,
+              replaces: float = 0.0, clickable: bool = False,
+              required: bool = False, grace: float = 0.0) -> Optional[Tuple[int, any]]:
+        """
+        Race several XPaths: each poll checks all of them, in order, in one
+        script call. Returns (index of the winning XPath, element) or None.
+        Only the first XPath may win during the first `grace` seconds, so a
+        broad fallback can't beat a specific selector that is still loading.
+        """
+        start = time.perf_counter()
+
+        def condition(driver):
+            found = driver.execute_script(_FIRST_MATCH_JS, xpaths, clickable)
+            if found and found[0] > 0 and time.perf_counter() - start < grace:
+                return False
+            return found or False
+
+        found = self.until(step, condition, timeout, replaces, required)
+        return tuple(found) if found else None
+
+    def arm(self):
+        """Install DOM/network probes now, so requests fired by the next action are counted"""
+        try:
+            self.driver.execute_script(_PROBE_JS)
+        except Exception as e:
+            logger.debug(f"Wait probe install failed: {e}")
+
+    def document_ready(self, step: str, timeout: Optional[float] = None,
+                       replaces: float = 0.0, required: bool = False) -> bool:
+        """Wait for document.readyState == 'complete'"""
+        condition = lambda d: d.execute_script("return document.readyState") == "complete"
+        return bool(self.until(step, condition, timeout, replaces, required))
+
+    def dom_quiet(self, step: str, quiet_ms: int = 250, timeout: Optional[float] = None,
+                  replaces: float = 0.0, required: bool = False) -> bool:
+        """Wait until no DOM mutation happened for quiet_ms"""
+        def condition(driver):
+            since_mutation, _, _ = driver.execute_script(_PROBE_JS)
+            return since_mutation >= quiet_ms
+
+        return bool(self.until(step, condition, timeout, replaces, required))
+
+    def network_idle(self, step: str, quiet_ms: int = 250, timeout: Optional[float] = None,
+                     replaces: float = 0.0, required: bool = False) -> bool:
+        """Wait until no fetch/XHR is in flight and the DOM has settled for quiet_ms"""
+        def condition(driver):
+            since_mutation, inflight, ready_state = driver.execute_script(_PROBE_JS)
+            return inflight <= 0 and ready_state == "complete" and since_mutation >= quiet_ms
+
+        return bool(self.until(step, condition, timeout, replaces, required))